@@ -2,14 +2,9 @@
 AST-Solidity包初始化文件
 """
 
+import importlib
+
 from .ast_builder.node_types import *
-from .ast_builder.ast_builder import ASTBuilder
-from .dfg_builder.dfg_builder import DFGBuilder
-from .json_serializer import JSONSerializer
-from .visualization.visualizer import DFGVisualizer
-from .ast_builder.solidity_04x_handler import Solidity04xHandler
-from .analyzer import SolidityAnalyzer
-from .main import SolidityPipeline
 
 __version__ = "1.0.0"
 __author__ = "AST-Solidity Team"
@@ -23,4 +18,24 @@ __all__ = [
     'Solidity04xHandler',
     'SolidityAnalyzer',
     'SolidityPipeline',
-]
\ No newline at end of file
+]
+
+# 导出名 -> 所在模块；首次访问时才导入，避免仅使用部分子模块时加载tree_sitter等重依赖
+_LAZY_EXPORTS = {
+    'ASTBuilder': '.ast_builder.ast_builder',
+    'DFGBuilder': '.dfg_builder.dfg_builder',
+    'JSONSerializer': '.json_serializer',
+    'DFGVisualizer': '.visualization.visualizer',
+    'Solidity04xHandler': '.ast_builder.solidity_04x_handler',
+    'SolidityAnalyzer': '.analyzer',
+    'SolidityPipeline': '.main',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -193,12 +193,13 @@ class SolidityAnalyzer:
             # 生成可视化
             if generate_visualization:
                 viz_path = self.output_dir / "graphs" / f"{actual_contract_name}_dfg"
-                if self.visualizer.visualize_dfg(dfg, str(viz_path)):
+                viz_stats = {}
+                if self.visualizer.visualize_dfg(dfg, str(viz_path), stats=viz_stats):
                     result["visualization_file"] = f"{viz_path}.png"
                 
-                # 导出可视化统计
+                # 导出可视化统计（复用渲染时收集的统计）
                 viz_stats_path = self.output_dir / "graphs" / f"{actual_contract_name}_viz_stats.json"
-                if self.visualizer.export_statistics(dfg, str(viz_stats_path)):
+                if self.visualizer.export_statistics(dfg, str(viz_stats_path), viz_stats):
                     result["viz_stats_file"] = str(viz_stats_path)
             
             return result
@@ -2,8 +2,23 @@
 AST Builder module.
 """
 
+import importlib
+
 from .node_types import *
-from .ast_builder import ASTBuilder
-from .solidity_04x_handler import Solidity04xHandler
 
-__all__ = ['ASTBuilder', 'Solidity04xHandler']
\ No newline at end of file
+__all__ = ['ASTBuilder', 'Solidity04xHandler']
+
+# 导出名 -> 所在模块；首次访问时才导入（ASTBuilder依赖tree_sitter）
+_LAZY_EXPORTS = {
+    'ASTBuilder': '.ast_builder',
+    'Solidity04xHandler': '.solidity_04x_handler',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,6 +4,7 @@ DFG构建配置模块
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Set, List, Optional
 from enum import Enum
 
@@ -141,9 +142,10 @@ class DFGConfig:
 
 
 # ==================== 节点分类定义 ====================
+# 均为只读的frozenset，成员判断为O(1)
 
 # 核心节点类型（必须保留）
-CRITICAL_NODE_TYPES = {
+CRITICAL_NODE_TYPES = frozenset({
     "contract",
     "interface",
     "library",
@@ -151,10 +153,10 @@ CRITICAL_NODE_TYPES = {
     "constructor_function",
     "modifier",
     "state_variable",
-}
+})
 
 # 重要节点类型（默认保留）
-IMPORTANT_NODE_TYPES = {
+IMPORTANT_NODE_TYPES = frozenset({
     "local_variable",
     "parameter",
     "expression",
@@ -165,19 +167,19 @@ IMPORTANT_NODE_TYPES = {
     "struct_declaration",
     "enum_declaration",
     "event_definition",
-}
+})
 
 # 辅助节点类型（可选保留）
-AUXILIARY_NODE_TYPES = {
+AUXILIARY_NODE_TYPES = frozenset({
     "number_literal",
     "string_literal",
     "boolean_literal",
     "expression_statement",
     "block",
-}
+})
 
 # 应该被过滤的节点类型（基于节点名称）
-KEYWORD_PATTERNS = {
+KEYWORD_PATTERNS = frozenset({
     "pragma", "solidity", "contract", "function", "public", "private",
     "internal", "external", "pure", "view", "payable", "constant",
     "memory", "storage", "calldata", "returns", "return", "if", "else",
@@ -187,19 +189,19 @@ KEYWORD_PATTERNS = {
     "uint8", "uint16", "uint32", "uint64", "uint128", "uint256",
     "int8", "int16", "int32", "int64", "int128", "int256",
     "bytes1", "bytes2", "bytes4", "bytes8", "bytes16", "bytes32",
-}
+})
 
 # 类型名称关键字
-TYPE_KEYWORDS = {
+TYPE_KEYWORDS = frozenset({
     "uint", "int", "address", "bool", "string", "bytes",
     "uint8", "uint16", "uint32", "uint64", "uint128", "uint256",
     "int8", "int16", "int32", "int64", "int128", "int256",
     "bytes1", "bytes2", "bytes4", "bytes8", "bytes16", "bytes32",
     "mapping", "struct", "enum",
-}
+})
 
 # 操作符
-OPERATORS = {
+OPERATORS = frozenset({
     "+", "-", "*", "/", "%", "**",
     "==", "!=", "<", ">", "<=", ">=",
     "&&", "||", "!",
@@ -207,12 +209,23 @@ OPERATORS = {
     "=", "+=", "-=", "*=", "/=", "%=",
     "++", "--",
     "?", ":",
-}
+})
 
 # 标点符号
-PUNCTUATION = {
+PUNCTUATION = frozenset({
     "(", ")", "{", "}", "[", "]",
     ";", ",", ".", "=>",
+})
+
+# 标识符文本落入以上任一集合即视为可丢弃（合并后只需一次查找）
+_DISCARD_TEXTS = KEYWORD_PATTERNS | TYPE_KEYWORDS | OPERATORS | PUNCTUATION
+
+# 节点优先级排序（数值越大越重要）
+_PRIORITY_ORDER = {
+    NodePriority.CRITICAL: 4,
+    NodePriority.IMPORTANT: 3,
+    NodePriority.AUXILIARY: 2,
+    NodePriority.DISCARD: 1,
 }
 
 
@@ -228,6 +241,13 @@ def get_node_priority(node_type: str, node_name: Optional[str] = None, node_text
     Returns:
         NodePriority: 节点优先级
     """
+    # 只有标识符节点的优先级取决于文本，其余节点只按类型缓存
+    return _node_priority(node_type, node_text if node_type == "identifier" else None)
+
+
+@lru_cache(maxsize=4096)
+def _node_priority(node_type: str, identifier_text: Optional[str]) -> NodePriority:
+    """按(节点类型, 标识符文本)缓存的优先级计算"""
     # 检查是否为核心节点
     if node_type in CRITICAL_NODE_TYPES:
         return NodePriority.CRITICAL
@@ -241,16 +261,8 @@ def get_node_priority(node_type: str, node_name: Optional[str] = None, node_text
         return NodePriority.AUXILIARY
     
     # 检查是否为关键字节点
-    if node_type == "identifier" and node_text:
-        text_lower = node_text.strip().lower()
-        if text_lower in KEYWORD_PATTERNS:
-            return NodePriority.DISCARD
-        if text_lower in TYPE_KEYWORDS:
-            return NodePriority.DISCARD
-        if text_lower in OPERATORS:
-            return NodePriority.DISCARD
-        if text_lower in PUNCTUATION:
-            return NodePriority.DISCARD
+    if identifier_text and identifier_text.strip().lower() in _DISCARD_TEXTS:
+        return NodePriority.DISCARD
     
     # 默认为辅助节点
     return NodePriority.AUXILIARY
@@ -281,14 +293,7 @@ def should_keep_node(node_type: str, node_name: str, node_text: str, config: DFG
     priority = get_node_priority(node_type, node_name, node_text)
     
     # 检查优先级阈值
-    priority_order = {
-        NodePriority.CRITICAL: 4,
-        NodePriority.IMPORTANT: 3,
-        NodePriority.AUXILIARY: 2,
-        NodePriority.DISCARD: 1,
-    }
-    
-    if priority_order[priority] < priority_order[config.min_node_priority]:
+    if _PRIORITY_ORDER[priority] < _PRIORITY_ORDER[config.min_node_priority]:
         return False
     
     # 特殊规则检查
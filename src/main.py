@@ -79,13 +79,13 @@ class SolidityPipeline:
         self.output_dir = Path(config.output.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # 初始化DFG配置
+        # 初始化DFG配置（只构造所选模式的配置）
         mode_map = {
-            'compact': DFGConfig.compact(),
-            'standard': DFGConfig.standard(),
-            'verbose': DFGConfig.verbose()
+            'compact': DFGConfig.compact,
+            'standard': DFGConfig.standard,
+            'verbose': DFGConfig.verbose
         }
-        self.dfg_config = mode_map.get(config.dfg.mode, DFGConfig.standard())
+        self.dfg_config = mode_map.get(config.dfg.mode, DFGConfig.standard)()
         
         # 初始化分析器
         self.analyzer = SolidityAnalyzer(
@@ -265,9 +265,11 @@ class SolidityPipeline:
                 start_time = time.time()
                 try:
                     viz_output = self.output_dir / f"{contract_name}_dfg"
+                    # JSON刚在上一步重新生成，跳过检查不会命中，直接渲染
                     success = self.visualizer.visualize_from_json(
                         str(dfg_json_path),
-                        str(viz_output)
+                        str(viz_output),
+                        force=True
                     )
                     if success:
                         result["steps"]["visualization"] = {
@@ -420,8 +422,7 @@ class SolidityPipeline:
             try:
                 # 将代码写入临时文件
                 temp_file = self.output_dir / f"temp_{contract_name}.sol"
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    f.write(entry.code)
+                temp_file.write_bytes(entry.code.encode('utf-8'))
                 
                 # 处理文件，传递label和metadata
                 result = self.process_file(temp_file, contract_name, 
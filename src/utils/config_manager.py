@@ -5,10 +5,18 @@ Configuration management for the AST-Solidity pipeline.
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 
 
+# Provider name -> (default base URL, default model)
+_PROVIDER_DEFAULTS = {
+    "qwen": ("https://dashscope.aliyuncs.com/compatible-mode/v1", "qwen-plus"),
+    "deepseek": ("https://api.deepseek.com", "deepseek-chat"),
+    "openai": ("https://api.openai.com/v1", "gpt-4"),
+}
+
+
 @dataclass
 class LLMProviderConfig:
     """Configuration for LLM provider."""
@@ -27,15 +35,10 @@ class LLMProviderConfig:
             self.model = os.getenv("LLM_MODEL")
         
         # Set defaults based on provider
-        if self.name == "qwen" and not self.base_url:
-            self.base_url = "https://dashscope.aliyuncs.com/compatible-mode/v1"
-            self.model = self.model or "qwen-plus"
-        elif self.name == "deepseek" and not self.base_url:
-            self.base_url = "https://api.deepseek.com"
-            self.model = self.model or "deepseek-chat"
-        elif self.name == "openai" and not self.base_url:
-            self.base_url = "https://api.openai.com/v1"
-            self.model = self.model or "gpt-4"
+        defaults = _PROVIDER_DEFAULTS.get(self.name)
+        if defaults and not self.base_url:
+            self.base_url, default_model = defaults
+            self.model = self.model or default_model
 
 
 @dataclass
@@ -50,27 +53,37 @@ class DetectionConfig:
     provider: LLMProviderConfig = field(default_factory=LLMProviderConfig)
 
 
+_DEFAULT_INCLUDE_TYPES = (
+    "contract_definition",
+    "function_definition",
+    "variable_declaration",
+    "assignment",
+    "function_call",
+    "if_statement",
+    "while_statement",
+    "for_statement",
+    "return",
+    "modifier_invocation",
+)
+
+_DEFAULT_EDGE_TYPES = (
+    "data_dependency",
+    "control_flow",
+    "call",
+)
+
+
 @dataclass
 class DFGConfig:
     """Configuration for DFG generation."""
     mode: str = "standard"  # compact, standard, verbose
-    include_types: list = field(default_factory=lambda: [
-        "contract_definition",
-        "function_definition",
-        "variable_declaration",
-        "assignment",
-        "function_call",
-        "if_statement",
-        "while_statement",
-        "for_statement",
-        "return",
-        "modifier_invocation"
-    ])
-    edge_types: list = field(default_factory=lambda: [
-        "data_dependency",
-        "control_flow",
-        "call"
-    ])
+    include_types: Tuple[str, ...] = _DEFAULT_INCLUDE_TYPES
+    edge_types: Tuple[str, ...] = _DEFAULT_EDGE_TYPES
+    
+    def __post_init__(self):
+        # Lists coming from JSON config files are stored as tuples too
+        self.include_types = tuple(self.include_types)
+        self.edge_types = tuple(self.edge_types)
 
 
 @dataclass
@@ -83,6 +96,20 @@ class OutputConfig:
     include_source_code: bool = False
 
 
+# Command line overrides: (argument name, setter applied when the argument is truthy)
+_ARG_OVERRIDES = (
+    ('output', lambda c, v: setattr(c.output, 'output_dir', v)),
+    ('mode', lambda c, v: setattr(c.dfg, 'mode', v)),
+    ('detect', lambda c, v: setattr(c.detection, 'enabled', True)),
+    ('concurrency', lambda c, v: setattr(c.detection, 'concurrency_limit', v)),
+    ('verbose', lambda c, v: setattr(c, 'verbose', True)),
+    ('api_key', lambda c, v: setattr(c.detection.provider, 'api_key', v)),
+    ('base_url', lambda c, v: setattr(c.detection.provider, 'base_url', v)),
+    ('model', lambda c, v: setattr(c.detection.provider, 'model', v)),
+    ('llm_provider', lambda c, v: setattr(c.detection.provider, 'name', v)),
+)
+
+
 @dataclass
 class PipelineConfig:
     """Main configuration for the pipeline."""
@@ -96,32 +123,24 @@ class PipelineConfig:
     def load_from_file(cls, config_path: str) -> 'PipelineConfig':
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-            
-            # Parse nested configs
-            config = cls()
+            data = json.loads(Path(config_path).read_bytes())
             
-            if 'solidity_version' in data:
-                config.solidity_version = data['solidity_version']
+            # Build nested configs straight from their sections; absent ones use field defaults
+            kwargs = {key: data[key] for key in ('solidity_version', 'verbose') if key in data}
             
             if 'dfg' in data:
-                config.dfg = DFGConfig(**data['dfg'])
+                kwargs['dfg'] = DFGConfig(**data['dfg'])
             
             if 'detection' in data:
                 det_data = data['detection']
                 if 'provider' in det_data:
-                    provider = LLMProviderConfig(**det_data['provider'])
-                    det_data['provider'] = provider
-                config.detection = DetectionConfig(**det_data)
+                    det_data = {**det_data, 'provider': LLMProviderConfig(**det_data['provider'])}
+                kwargs['detection'] = DetectionConfig(**det_data)
             
             if 'output' in data:
-                config.output = OutputConfig(**data['output'])
+                kwargs['output'] = OutputConfig(**data['output'])
             
-            if 'verbose' in data:
-                config.verbose = data['verbose']
-            
-            return config
+            return cls(**kwargs)
             
         except FileNotFoundError:
             # Return default config if file not found
@@ -134,39 +153,17 @@ class PipelineConfig:
     def load_from_args(cls, args) -> 'PipelineConfig':
         """Load configuration from command line arguments."""
         config = cls()
+        overrides = vars(args)
         
         # Load from file if specified
-        if hasattr(args, 'config') and args.config:
-            config = cls.load_from_file(args.config)
+        if overrides.get('config'):
+            config = cls.load_from_file(overrides['config'])
         
         # Override with command line arguments
-        if hasattr(args, 'output') and args.output:
-            config.output.output_dir = args.output
-        
-        if hasattr(args, 'mode') and args.mode:
-            config.dfg.mode = args.mode
-        
-        if hasattr(args, 'detect') and args.detect:
-            config.detection.enabled = True
-        
-        if hasattr(args, 'concurrency') and args.concurrency:
-            config.detection.concurrency_limit = args.concurrency
-        
-        if hasattr(args, 'verbose') and args.verbose:
-            config.verbose = True
-        
-        # Load LLM config from args
-        if hasattr(args, 'api_key') and args.api_key:
-            config.detection.provider.api_key = args.api_key
-        
-        if hasattr(args, 'base_url') and args.base_url:
-            config.detection.provider.base_url = args.base_url
-        
-        if hasattr(args, 'model') and args.model:
-            config.detection.provider.model = args.model
-        
-        if hasattr(args, 'llm_provider') and args.llm_provider:
-            config.detection.provider.name = args.llm_provider
+        for name, apply in _ARG_OVERRIDES:
+            value = overrides.get(name)
+            if value:
+                apply(config, value)
         
         # Load from environment if not set
         config.detection.provider.load_from_env()
@@ -177,8 +174,9 @@ class PipelineConfig:
         """Save configuration to JSON file."""
         Path(config_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        # json.dumps uses the C encoder when indent is None; json.dump never does
+        indent = 2 if self.output.prettify else None
+        Path(config_path).write_text(json.dumps(asdict(self), indent=indent))
     
     def __repr__(self) -> str:
         return f"PipelineConfig(solidity_version={self.solidity_version}, dfg_mode={self.dfg.mode}, detection_enabled={self.detection.enabled})"
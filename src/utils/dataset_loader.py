@@ -4,12 +4,23 @@ Supports various dataset formats including labeled contract collections.
 """
 
 import json
+import os
+import re
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union, BinaryIO
 from dataclasses import dataclass
 
 from .result import Result
 
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_get_code = itemgetter('code')
+
+
+class DatasetFormatError(Exception):
+    """Raised when a JSON document is not a supported dataset format."""
+
 
 @dataclass
 class ContractEntry:
@@ -48,6 +59,10 @@ class DatasetLoader:
         3. Object with 'data' array:
            {"data": [{"code": "...", "label": 0}, ...]}
         
+        4. JSON Lines (one object per line):
+           {"code": "...", "label": 0}
+           {"code": "...", "label": 1}
+        
         Args:
             dataset_path: Path to JSON dataset file
             
@@ -60,30 +75,12 @@ class DatasetLoader:
             if not path.exists():
                 return Result.failure(f"Dataset file not found: {dataset_path}")
             
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Handle different dataset formats
-            contracts_data = None
-            
-            if isinstance(data, list):
-                # Format 1: Direct array
-                contracts_data = data
-            elif isinstance(data, dict):
-                # Format 2 or 3: Object with contracts/data array
-                if 'contracts' in data:
-                    contracts_data = data['contracts']
-                elif 'data' in data:
-                    contracts_data = data['data']
-                else:
-                    return Result.failure(
-                        "Dataset must be an array or object with 'contracts' or 'data' field"
-                    )
-            else:
-                return Result.failure("Invalid dataset format")
+            contracts_data = DatasetLoader._iter_records(path.read_bytes().decode('utf-8-sig'))
             
             # Parse contract entries
             entries = []
+            # Identical sources (forks, copied libraries) share one string object
+            seen_codes: Dict[str, str] = {}
             for idx, item in enumerate(contracts_data):
                 if not isinstance(item, dict):
                     return Result.failure(f"Invalid contract entry at index {idx}")
@@ -92,6 +89,7 @@ class DatasetLoader:
                     return Result.failure(f"Missing 'code' field at index {idx}")
                 
                 entry = ContractEntry.from_dict(item, idx)
+                entry.code = seen_codes.setdefault(entry.code, entry.code)
                 entries.append(entry)
             
             if not entries:
@@ -101,9 +99,122 @@ class DatasetLoader:
             
         except json.JSONDecodeError as e:
             return Result.failure(f"Invalid JSON format: {e}")
+        except DatasetFormatError as e:
+            return Result.failure(str(e))
+        except Exception as e:
+            return Result.failure(f"Failed to load dataset: {e}")
+    
+    @staticmethod
+    def load_dataset(dataset_path: Union[str, os.PathLike, BinaryIO],
+                     limit: Optional[int] = None) -> Result[List[Dict[str, Any]]]:
+        """
+        Load the raw records of a JSON dataset as dictionaries.
+        
+        Accepts the same formats as load_json_dataset. Records of a top-level array or
+        a JSON Lines file are decoded one at a time, so with a limit the remainder of
+        the file is never decoded.
+        
+        Args:
+            dataset_path: Path to JSON dataset file, or a binary file-like object
+            limit: Maximum number of records to load (None for all)
+            
+        Returns:
+            Result containing list of record dictionaries
+        """
+        try:
+            if isinstance(dataset_path, (str, os.PathLike)):
+                path = Path(dataset_path)
+                
+                if not path.exists():
+                    return Result.failure(f"Dataset file not found: {dataset_path}")
+                
+                content = path.read_bytes()
+            else:
+                content = dataset_path.read()
+            
+            records = DatasetLoader._iter_records(content.decode('utf-8-sig'),
+                                                  incremental=limit is not None)
+            return Result.success(list(islice(records, limit)))
+            
+        except json.JSONDecodeError as e:
+            return Result.failure(f"Invalid JSON format: {e}")
+        except DatasetFormatError as e:
+            return Result.failure(str(e))
         except Exception as e:
             return Result.failure(f"Failed to load dataset: {e}")
     
+    @staticmethod
+    def _iter_records(text: str, incremental: bool = False) -> Iterator[Any]:
+        """
+        Lazily decode the records of a dataset document.
+        
+        JSON Lines streams are decoded record by record. Top-level arrays are
+        decoded element by element only when incremental is set (a limited load
+        that may stop early); otherwise a single parse of the whole array is
+        faster. Objects with a 'contracts' or 'data' array are decoded whole.
+        
+        Raises:
+            json.JSONDecodeError: If the text is not valid JSON
+            DatasetFormatError: If the document is not a supported dataset format
+        """
+        decoder = json.JSONDecoder()
+        end = len(text)
+        pos = _JSON_WHITESPACE.match(text).end()
+        
+        if incremental and text.startswith('[', pos):
+            # Format 1: Direct array, one element at a time
+            pos = _JSON_WHITESPACE.match(text, pos + 1).end()
+            if not text.startswith(']', pos):
+                while True:
+                    record, pos = decoder.raw_decode(text, pos)
+                    yield record
+                    pos = _JSON_WHITESPACE.match(text, pos).end()
+                    if text.startswith(']', pos):
+                        break
+                    if not text.startswith(',', pos):
+                        raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+                    pos = _JSON_WHITESPACE.match(text, pos + 1).end()
+            pos = _JSON_WHITESPACE.match(text, pos + 1).end()
+            if pos != end:
+                raise json.JSONDecodeError("Extra data", text, pos)
+            return
+        
+        data, pos = decoder.raw_decode(text, pos)
+        pos = _JSON_WHITESPACE.match(text, pos).end()
+        
+        if pos != end:
+            if isinstance(data, list):
+                raise json.JSONDecodeError("Extra data", text, pos)
+            
+            # Format 4: JSON Lines, one document at a time
+            yield data
+            while pos < end:
+                record, pos = decoder.raw_decode(text, pos)
+                yield record
+                pos = _JSON_WHITESPACE.match(text, pos).end()
+            return
+        
+        if isinstance(data, list):
+            # Format 1: Direct array
+            yield from data
+            return
+        
+        if not isinstance(data, dict):
+            raise DatasetFormatError("Invalid dataset format")
+        
+        # Format 2 or 3: Object with contracts/data array
+        if 'contracts' in data:
+            yield from data['contracts']
+        elif 'data' in data:
+            yield from data['data']
+        elif 'code' in data:
+            # Format 4 with a single record
+            yield data
+        else:
+            raise DatasetFormatError(
+                "Dataset must be an array or object with 'contracts' or 'data' field"
+            )
+    
     @staticmethod
     def load_directory(directory_path: str, extension: str = ".sol") -> Result[List[ContractEntry]]:
         """
@@ -167,3 +278,42 @@ class DatasetLoader:
             return Result.failure("Contract code exceeds size limit (1MB)")
         
         return Result.success(True)
+    
+    @staticmethod
+    def validate_dataset(dataset: List[Dict[str, Any]]) -> Result[bool]:
+        """Validate that every record is a dictionary with a 'code' field."""
+        for idx, record in enumerate(dataset):
+            if not isinstance(record, dict):
+                return Result.failure(f"Invalid contract entry at index {idx}")
+            
+            if 'code' not in record:
+                return Result.failure(f"Missing 'code' field at index {idx}")
+        
+        return Result.success(True)
+    
+    @staticmethod
+    def extract_codes(dataset: List[Dict[str, Any]]) -> List[str]:
+        """Extract the 'code' field of every record."""
+        return list(map(_get_code, dataset))
+    
+    @staticmethod
+    def extract_labels(dataset: List[Dict[str, Any]]) -> List[Any]:
+        """Extract the 'label' field of every record (None when missing)."""
+        return [record.get('label') for record in dataset]
+    
+    @staticmethod
+    def extract(dataset: List[Dict[str, Any]]) -> Tuple[List[str], List[Any]]:
+        """Extract codes and labels together in a single pass over the records."""
+        codes: List[str] = []
+        labels: List[Any] = []
+        add_code = codes.append
+        add_label = labels.append
+        for record in dataset:
+            add_code(record['code'])
+            add_label(record.get('label'))
+        return codes, labels
+    
+    @staticmethod
+    def filter_by_label(dataset: List[Dict[str, Any]], label: Any) -> List[Dict[str, Any]]:
+        """Return the records whose 'label' equals the given label."""
+        return [record for record in dataset if record.get('label') == label]
@@ -4,8 +4,8 @@ Provides pure functions and common functional patterns.
 """
 
 from functools import wraps, partial
+from itertools import chain
 from typing import Any, Callable, List, Dict, TypeVar, Union, Optional
-from toolz import curry, pipe, compose
 import json
 
 T = TypeVar('T')
@@ -32,7 +32,6 @@ def safe_execute(func: Callable[..., T], default: T) -> Callable[..., T]:
     return wrapper
 
 
-@curry
 def filter_dict(predicate: Callable[[str, Any], bool], data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter dictionary items based on predicate.
@@ -47,7 +46,6 @@ def filter_dict(predicate: Callable[[str, Any], bool], data: Dict[str, Any]) ->
     return {k: v for k, v in data.items() if predicate(k, v)}
 
 
-@curry
 def map_dict(transformer: Callable[[Any], Any], data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform dictionary values.
@@ -72,10 +70,9 @@ def flatten(nested_list: List[List[T]]) -> List[T]:
     Returns:
         Flattened list
     """
-    return [item for sublist in nested_list for item in sublist]
+    return list(chain.from_iterable(nested_list))
 
 
-@curry
 def pluck(key: str, list_of_dicts: List[Dict[str, Any]]) -> List[Any]:
     """
     Extract a specific key from a list of dictionaries.
@@ -81,6 +81,18 @@ class Result(Generic[T]):
         except Exception as e:
             return Result.failure(str(e))
     
+    def map_unchecked(self, fn: Callable[[T], Any]) -> 'Result':
+        """Map the value if successful, letting exceptions from fn propagate."""
+        if self.is_failure:
+            return self
+        return Result.success(fn(self._value))
+    
+    def flat_map_unchecked(self, fn: Callable[[T], 'Result']) -> 'Result':
+        """Flat map the value if successful, letting exceptions from fn propagate."""
+        if self.is_failure:
+            return self
+        return fn(self._value)
+    
     def unwrap_or(self, default: T) -> T:
         """Get value or default if failure."""
         return self.value if self.is_success else default
@@ -3,13 +3,63 @@ Graphviz可视化器模块
 使用Graphviz将DFG可视化
 """
 
-import graphviz
-from typing import Dict, Any, Optional, List, Tuple
+import os
+import re
+import subprocess
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple, Iterable
 from pathlib import Path
 import json
 
 from ..ast_builder.node_types import DFG, DFGNode, DFGEdge, EdgeType
 
+class NodeStyle(NamedTuple):
+    """节点样式"""
+    shape: str
+    style: str
+    fillcolor: str
+    fontname: str
+
+
+class EdgeStyle(NamedTuple):
+    """边样式"""
+    color: str
+    style: str
+    arrowhead: str
+
+
+# 图级属性（所有图共用）
+_GRAPH_ATTRS = "\tnodesep=0.8 rankdir=TB ranksep=1.0 splines=ortho\n"
+
+# 边线宽，按权重索引（权重超过5按5计）
+_PENWIDTH = ("1", "1", "2", "3", "4", "5")
+
+# 聚类图中节点的默认字体（在图级设置一次，节点上不再重复）
+_CLUSTER_FONTNAME = "Arial"
+
+
+# 未转义的双引号（已转义的 \" 视同 "，与graphviz.quote一致）
+_UNESCAPED_QUOTE = re.compile(r'((?:\\{2})*)\\?"')
+
+# 结尾的奇数个反斜杠（会转义掉收尾引号）
+_FINAL_ODD_BACKSLASHES = re.compile(r'(?<!\\)(?:\\{2})*\\$')
+
+
+def _quote(value: Any) -> str:
+    """将ID或属性值转为DOT带引号字符串（保留\\n等转义，只转义未转义的双引号）"""
+    text = str(value)
+    if '"' in text:
+        text = _UNESCAPED_QUOTE.sub(r'\1\\"', text)
+    if text.endswith("\\") and _FINAL_ODD_BACKSLASHES.search(text):
+        text += "\\"
+    return '"' + text + '"'
+
+
+def _format_attrs(attrs: Dict[str, Any]) -> str:
+    """将属性字典格式化为DOT属性列表"""
+    return " ".join(f"{key}={_quote(value)}" for key, value in attrs.items())
+
 
 class DFGVisualizer:
     """DFG可视化器"""
@@ -20,117 +70,49 @@ class DFGVisualizer:
         self.format = format
         
         # 节点样式配置
-        self.node_styles = {
-            "contract": {
-                "shape": "box",
-                "style": "rounded,filled",
-                "fillcolor": "lightblue",
-                "fontname": "Arial"
-            },
-            "function": {
-                "shape": "ellipse",
-                "style": "filled",
-                "fillcolor": "lightgreen",
-                "fontname": "Arial"
-            },
-            "constructor_function": {
-                "shape": "doubleellipse",
-                "style": "filled",
-                "fillcolor": "orange",
-                "fontname": "Arial"
-            },
-            "state_variable": {
-                "shape": "note",
-                "style": "filled",
-                "fillcolor": "lightyellow",
-                "fontname": "Arial"
-            },
-            "local_variable": {
-                "shape": "ellipse",
-                "style": "filled",
-                "fillcolor": "lightgray",
-                "fontname": "Arial"
-            },
-            "expression": {
-                "shape": "circle",
-                "style": "filled",
-                "fillcolor": "lightpink",
-                "fontname": "Arial"
-            },
-            "parameter": {
-                "shape": "parallelogram",
-                "style": "filled",
-                "fillcolor": "lightcyan",
-                "fontname": "Arial"
-            }
+        self.node_styles: Dict[str, NodeStyle] = {
+            "contract": NodeStyle("box", "rounded,filled", "lightblue", "Arial"),
+            "function": NodeStyle("ellipse", "filled", "lightgreen", "Arial"),
+            "constructor_function": NodeStyle("doubleellipse", "filled", "orange", "Arial"),
+            "state_variable": NodeStyle("note", "filled", "lightyellow", "Arial"),
+            "local_variable": NodeStyle("ellipse", "filled", "lightgray", "Arial"),
+            "expression": NodeStyle("circle", "filled", "lightpink", "Arial"),
+            "parameter": NodeStyle("parallelogram", "filled", "lightcyan", "Arial"),
         }
         
         # 边样式配置
-        self.edge_styles = {
-            EdgeType.DATA_DEPENDENCY: {
-                "color": "black",
-                "style": "solid",
-                "arrowhead": "normal"
-            },
-            EdgeType.CONTROL_DEPENDENCY: {
-                "color": "red",
-                "style": "dashed",
-                "arrowhead": "empty"
-            },
-            EdgeType.FUNCTION_CALL: {
-                "color": "blue",
-                "style": "dotted",
-                "arrowhead": "diamond"
-            },
-            EdgeType.DEFINITION: {
-                "color": "green",
-                "style": "solid",
-                "arrowhead": "tee"
-            },
-            EdgeType.USAGE: {
-                "color": "purple",
-                "style": "solid",
-                "arrowhead": "normal"
-            },
-            EdgeType.MODIFIES: {
-                "color": "darkred",
-                "style": "bold",
-                "arrowhead": "box"
-            }
+        self.edge_styles: Dict[EdgeType, EdgeStyle] = {
+            EdgeType.DATA_DEPENDENCY: EdgeStyle("black", "solid", "normal"),
+            EdgeType.CONTROL_DEPENDENCY: EdgeStyle("red", "dashed", "empty"),
+            EdgeType.FUNCTION_CALL: EdgeStyle("blue", "dotted", "diamond"),
+            EdgeType.DEFINITION: EdgeStyle("green", "solid", "tee"),
+            EdgeType.USAGE: EdgeStyle("purple", "solid", "normal"),
+            EdgeType.MODIFIES: EdgeStyle("darkred", "bold", "box"),
         }
+        
+        # 已解析DFG的缓存；缓存的DFG会被多次渲染复用，调用方不应修改它
+        self._load_dfg_cached = lru_cache(maxsize=32)(self._load_dfg)
+        
+        # 各次渲染复用的DOT文本缓冲区（同一实例不支持多线程同时生成DOT）
+        self._dot_buf: List[str] = []
     
     def visualize_dfg(self, dfg: DFG, output_path: str, 
                      show_labels: bool = True, 
-                     cluster_scopes: bool = True) -> bool:
-        """可视化DFG"""
+                     cluster_scopes: bool = True,
+                     stats: Optional[Dict[str, Any]] = None) -> bool:
+        """可视化DFG
+        
+        传入stats字典时，会在生成DOT文本的同一遍遍历中填入可视化统计信息
+        （格式同export_statistics中的visualization_stats），可再传给export_statistics复用。
+        """
         try:
-            # 创建Graphviz图
-            dot = graphviz.Digraph(comment=f'DFG of {dfg.contract_name}',
-                                 engine=self.engine,
-                                 format=self.format)
-            
-            # 设置图属性
-            dot.attr(rankdir='TB', splines='ortho', nodesep='0.8', ranksep='1.0')
-            
-            # 添加节点
-            self._add_nodes(dot, dfg, show_labels)
-            
-            # 添加边
-            self._add_edges(dot, dfg, show_labels)
-            
-            # 如果需要，按作用域聚类
-            if cluster_scopes:
-                dot = self._create_clustered_graph(dfg, show_labels)
+            collected: Optional[Dict[str, Any]] = {} if stats is not None else None
+            source = self._build_source(dfg, show_labels, cluster_scopes, collected)
+            if stats is not None:
+                stats.update(self._summarize_stats(dfg, collected))
             
             # 渲染图
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if isinstance(dot, graphviz.Digraph):
-                dot.render(str(output_file.with_suffix('')), cleanup=True)
-            else:
-                # 如果是聚类图，需要特殊处理
-                dot.render(str(output_file.with_suffix('')), cleanup=True)
+            self._render(source, output_path)
             
             return True
         
@@ -138,18 +120,91 @@ class DFGVisualizer:
             print(f"Error visualizing DFG: {e}")
             return False
     
+    def _build_source(self, dfg: DFG, show_labels: bool, cluster_scopes: bool,
+                      stats: Optional[Dict[str, Any]] = None) -> str:
+        """生成完整的DOT文本"""
+        # 直接生成DOT文本，不构建graphviz对象图；聚类与平铺只走其一
+        if cluster_scopes:
+            lines = self._create_clustered_graph(dfg, show_labels, stats)
+        else:
+            lines = self._build_flat_graph(dfg, show_labels, stats)
+        
+        lines.append("}\n")
+        source = "".join(lines)
+        lines.clear()
+        return source
+    
+    def _build_flat_graph(self, dfg: DFG, show_labels: bool,
+                          stats: Optional[Dict[str, Any]] = None) -> List[str]:
+        """创建不聚类的平铺图"""
+        lines = self._begin_graph(f'DFG of {dfg.contract_name}')
+        
+        # 添加节点
+        self._add_nodes(lines, dfg.nodes.items(), show_labels, stats=stats)
+        
+        # 添加边
+        self._add_edges(lines, dfg, show_labels, stats)
+        
+        return lines
+    
+    def _begin_graph(self, comment: str) -> List[str]:
+        """清空复用的DOT文本缓冲区并写入图头"""
+        lines = self._dot_buf
+        lines.clear()
+        lines.extend((f"// {comment}\n", "digraph {\n", _GRAPH_ATTRS))
+        return lines
+    
+    def _render(self, source: str, output_path: str) -> None:
+        """调用Graphviz引擎将DOT文本渲染为 <output_path去后缀>.<format>"""
+        target = self._target_path(output_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        
+        result = subprocess.run(
+            [self.engine, f"-T{self.format}", "-o", str(target)],
+            input=source.encode("utf-8"),
+            capture_output=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8", "replace").strip()
+                               or f"{self.engine} exited with status {result.returncode}")
+    
+    def _target_path(self, output_path: str) -> Path:
+        """渲染输出文件路径：<output_path去后缀>.<format>"""
+        return Path(f"{Path(output_path).with_suffix('')}.{self.format}")
+    
     def visualize_from_json(self, json_file: str, output_path: str,
                            show_labels: bool = True,
-                           cluster_scopes: bool = True) -> bool:
-        """从JSON文件加载并可视化DFG"""
+                           cluster_scopes: bool = True,
+                           force: bool = False) -> bool:
+        """从JSON文件加载并可视化DFG
+        
+        输出文件不早于JSON、且上次由同一JSON文件以相同的引擎和选项渲染时跳过渲染；
+        这些信息记录在输出文件旁的 <输出文件>.opts 中。force=True时总是重新渲染，
+        且不写入（并删除已有的）记录文件。
+        """
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            stat = os.stat(json_file)
+            options = json.dumps([str(Path(json_file).resolve()), self.engine,
+                                  show_labels, cluster_scopes])
+            options_path = self._options_path(output_path)
             
-            # 创建虚拟DFG对象
-            dfg = self._create_dfg_from_json(data)
+            # 输出已是最新时直接复用
+            if not force and self._is_up_to_date(output_path, stat.st_mtime_ns, options):
+                return True
             
-            return self.visualize_dfg(dfg, output_path, show_labels, cluster_scopes)
+            # 文件未变化时复用已解析的DFG（按修改时间和大小判断）
+            dfg = self._load_dfg_cached(str(json_file), stat.st_mtime_ns, stat.st_size)
+            
+            if force:
+                options_path.unlink(missing_ok=True)
+                return self.visualize_dfg(dfg, output_path, show_labels, cluster_scopes)
+            
+            if not self.visualize_dfg(dfg, output_path, show_labels, cluster_scopes):
+                return False
+            
+            # 渲染成功后再记录选项，使记录不早于输出文件
+            options_path.write_text(options, encoding="utf-8")
+            return True
         
         except Exception as e:
             print(f"Error visualizing DFG from JSON: {e}")
@@ -157,61 +212,140 @@ class DFGVisualizer:
             traceback.print_exc()
             return False
     
-    def _add_nodes(self, dot: graphviz.Digraph, dfg: DFG, show_labels: bool) -> None:
-        """添加节点到图中"""
-        for node_id, node in dfg.nodes.items():
+    def _options_path(self, output_path: str) -> Path:
+        """记录渲染选项的附属文件路径：<渲染输出文件>.opts"""
+        target = self._target_path(output_path)
+        return target.with_name(target.name + ".opts")
+    
+    def _is_up_to_date(self, output_path: str, source_mtime_ns: int, options: str) -> bool:
+        """输出文件不早于输入JSON，且选项记录不早于输出文件并与options一致时返回True
+        
+        输出被其他调用（如直接调用visualize_dfg）重新渲染后，选项记录会早于输出文件而失效。
+        """
+        target = self._target_path(output_path)
+        options_path = self._options_path(output_path)
+        try:
+            target_mtime_ns = target.stat().st_mtime_ns
+            if target_mtime_ns < source_mtime_ns:
+                return False
+            if options_path.stat().st_mtime_ns < target_mtime_ns:
+                return False
+            return options_path.read_text(encoding="utf-8") == options
+        except FileNotFoundError:
+            return False
+    
+    def _load_dfg(self, json_file: str, mtime_ns: int, size: int) -> DFG:
+        """解析JSON文件并创建DFG（mtime_ns/size仅作为缓存键）"""
+        data = json.loads(Path(json_file).read_bytes())
+        
+        # 创建虚拟DFG对象
+        return self._create_dfg_from_json(data)
+    
+    def _add_nodes(self, lines: List[str], node_items: Iterable[Tuple[str, DFGNode]],
+                   show_labels: bool, indent: str = "\t",
+                   default_fontname: Optional[str] = None,
+                   stats: Optional[Dict[str, Any]] = None) -> None:
+        """添加节点到DOT文本（与default_fontname相同的字体不再逐节点写出；
+        传入stats时顺带累计节点类型和作用域）"""
+        # 循环内频繁访问的属性绑定为局部变量
+        get_style = self.node_styles.get
+        default_style = self.node_styles["expression"]
+        make_label = self._create_node_label
+        add = lines.append
+        if stats is not None:
+            node_types = stats.setdefault("node_types", Counter())
+            scopes = stats.setdefault("scopes", set())
+        
+        for node_id, node in node_items:
+            if stats is not None:
+                node_types[node.node_type] += 1
+                if node.scope:
+                    scopes.add(node.scope)
+            
             # 获取节点样式
-            style = self.node_styles.get(node.node_type, self.node_styles["expression"])
+            shape, style, fillcolor, fontname = get_style(node.node_type, default_style)
             
-            # 创建节点标签
-            label = self._create_node_label(node, show_labels)
+            # 创建节点标签（不显示详细标签时直接用节点ID，不调用标签函数）
+            label = make_label(node, show_labels) if show_labels else node.node_id
+            
+            # 无特殊属性时直接拼接，不构造属性字典
+            if not node.properties:
+                font_attr = "" if fontname == default_fontname else f" fontname={_quote(fontname)}"
+                add(
+                    f'{indent}{_quote(node_id)} [label={_quote(label)} shape={_quote(shape)} '
+                    f'style={_quote(style)} fillcolor={_quote(fillcolor)}{font_attr}]\n'
+                )
+                continue
             
-            # 添加节点属性
             node_attrs = {
                 "label": label,
-                "shape": style["shape"],
-                "style": style["style"],
-                "fillcolor": style["fillcolor"],
-                "fontname": style["fontname"]
+                "shape": shape,
+                "style": style,
+                "fillcolor": fillcolor
             }
+            if fontname != default_fontname:
+                node_attrs["fontname"] = fontname
             
-            # 添加特殊属性
-            if node.properties:
-                # 0.4.x特殊标记
-                if node.properties.get("is_legacy_constructor"):
-                    node_attrs["penwidth"] = "3"
-                    node_attrs["color"] = "orange"
-                
-                if node.properties.get("has_constant_modifier"):
-                    node_attrs["peripheries"] = "2"
-                
-                if node.properties.get("uses_now_keyword"):
-                    node_attrs["style"] = style["style"] + ",diagonals"
+            # 0.4.x特殊标记
+            if node.properties.get("is_legacy_constructor"):
+                node_attrs["penwidth"] = "3"
+                node_attrs["color"] = "orange"
+            
+            if node.properties.get("has_constant_modifier"):
+                node_attrs["peripheries"] = "2"
             
-            dot.node(node_id, **node_attrs)
+            if node.properties.get("uses_now_keyword"):
+                node_attrs["style"] = style + ",diagonals"
+            
+            add(f"{indent}{_quote(node_id)} [{_format_attrs(node_attrs)}]\n")
     
-    def _add_edges(self, dot: graphviz.Digraph, dfg: DFG, show_labels: bool) -> None:
-        """添加边到图中"""
-        for edge_id, edge in dfg.edges.items():
+    def _add_edges(self, lines: List[str], dfg: DFG, show_labels: bool,
+                   stats: Optional[Dict[str, Any]] = None) -> None:
+        """添加边到DOT文本（传入stats时顺带累计边类型）"""
+        # 每种边类型的样式和类型名只查一次：edge_type -> (样式, 类型名)
+        default_style = self.edge_styles[EdgeType.DATA_DEPENDENCY]
+        edge_info = {
+            edge_type: (self.edge_styles.get(edge_type, default_style), edge_type.value)
+            for edge_type in EdgeType
+        }
+        add = lines.append
+        if stats is not None:
+            edge_types = stats.setdefault("edge_types", Counter())
+        
+        for edge in dfg.edges.values():
             # 获取边样式
-            style = self.edge_styles.get(edge.edge_type, self.edge_styles[EdgeType.DATA_DEPENDENCY])
-            
-            # 创建边标签
-            label = self._create_edge_label(edge, show_labels)
+            info = edge_info.get(edge.edge_type)
+            if info is None:
+                # 表外的边类型使用默认样式
+                info = (self.edge_styles.get(edge.edge_type, default_style), edge.edge_type.value)
+            (color, style, arrowhead), type_value = info
+            if stats is not None:
+                edge_types[type_value] += 1
+            weight = edge.weight
             
             # 添加边属性
             edge_attrs = {
-                "color": style["color"],
-                "style": style["style"],
-                "arrowhead": style["arrowhead"]
+                "color": color,
+                "style": style,
+                "arrowhead": arrowhead
             }
             
-            if label:
+            # 创建边标签：类型、自定义标签、权重
+            if show_labels:
+                label = type_value
+                if edge.label:
+                    label += " " + edge.label
+                if weight > 1:
+                    label += f" w:{weight}"
                 edge_attrs["label"] = label
             
             # 添加权重属性
-            if edge.weight > 1:
-                edge_attrs["penwidth"] = str(min(edge.weight, 5))
+            if weight > 1:
+                # 来自JSON的权重可能是浮点数，只有整数权重查表
+                if isinstance(weight, int):
+                    edge_attrs["penwidth"] = _PENWIDTH[min(weight, 5)]
+                else:
+                    edge_attrs["penwidth"] = str(min(weight, 5))
             
             # 添加特殊属性
             if edge.properties:
@@ -220,89 +354,63 @@ class DFGVisualizer:
                 elif edge.properties.get("relation") == "state-var-use":
                     edge_attrs["fontcolor"] = "darkgreen"
             
-            dot.edge(edge.source_node_id, edge.target_node_id, **edge_attrs)
+            add(f"\t{_quote(edge.source_node_id)} -> {_quote(edge.target_node_id)} [{_format_attrs(edge_attrs)}]\n")
     
     def _create_node_label(self, node: DFGNode, show_labels: bool) -> str:
         """创建节点标签"""
         if not show_labels:
             return node.node_id
         
-        label_parts = []
-        
         # 节点类型
-        label_parts.append(f"[{node.node_type}]")
+        label = f"[{node.node_type}]"
         
         # 节点名称
         if node.name:
-            label_parts.append(node.name)
+            label += "\\n" + node.name
         
         # 数据类型
         if node.data_type:
-            label_parts.append(f": {node.data_type}")
+            label += "\\n: " + node.data_type
         
         # 作用域
-        if node.scope and node.scope != "global":
-            label_parts.append(f"({node.scope})")
-        
-        return "\\n".join(label_parts)
-    
-    def _create_edge_label(self, edge: DFGEdge, show_labels: bool) -> str:
-        """创建边标签"""
-        if not show_labels:
-            return ""
-        
-        label_parts = []
-        
-        # 边类型
-        label_parts.append(edge.edge_type.value)
+        scope = node.scope
+        if scope and scope != "global":
+            label += f"\\n({scope})"
         
-        # 自定义标签
-        if edge.label:
-            label_parts.append(edge.label)
-        
-        # 权重
-        if edge.weight > 1:
-            label_parts.append(f"w:{edge.weight}")
-        
-        return " ".join(label_parts)
+        return label
     
-    def _create_clustered_graph(self, dfg: DFG, show_labels: bool) -> graphviz.Digraph:
-        """创建按作用域聚类的图"""
-        dot = graphviz.Digraph(comment=f'Clustered DFG of {dfg.contract_name}',
-                             engine=self.engine,
-                             format=self.format)
-        
-        dot.attr(rankdir='TB', splines='ortho', nodesep='0.8', ranksep='1.0')
+    def _create_clustered_graph(self, dfg: DFG, show_labels: bool,
+                                stats: Optional[Dict[str, Any]] = None) -> List[str]:
+        """创建按作用域聚类的图（每个非全局作用域一个 subgraph cluster）"""
+        lines = self._begin_graph(f'Clustered DFG of {dfg.contract_name}')
+        lines.append(f"\tnode [fontname={_quote(_CLUSTER_FONTNAME)}]\n")
         
         # 按作用域分组节点
-        scopes = {}
+        scopes: Dict[str, List[Tuple[str, DFGNode]]] = defaultdict(list)
         for node_id, node in dfg.nodes.items():
-            scope = node.scope or "global"
-            if scope not in scopes:
-                scopes[scope] = []
-            scopes[scope].append(node)
+            scopes[node.scope or "global"].append((node_id, node))
         
-        # 暂时禁用聚类功能以避免graphviz API问题
-        # 直接添加所有节点到主图
-        for node_id, node in dfg.nodes.items():
-            style = self.node_styles.get(node.node_type, self.node_styles["expression"])
-            label = self._create_node_label(node, show_labels)
-            
-            dot.node(node_id, 
-                    label=label,
-                    shape=style["shape"],
-                    style=style["style"],
-                    fillcolor=style["fillcolor"],
-                    fontname=style["fontname"])
+        # 全局节点直接放在主图中
+        global_nodes = scopes.pop("global", ())
+        self._add_nodes(lines, global_nodes, show_labels,
+                        default_fontname=_CLUSTER_FONTNAME, stats=stats)
+        
+        # 其余作用域各自成为一个聚类
+        for i, (scope, scope_nodes) in enumerate(scopes.items()):
+            lines.append(f'\tsubgraph "cluster_{i}" {{\n'
+                         f'\t\tlabel={_quote(scope)} style="rounded,dashed"\n')
+            self._add_nodes(lines, scope_nodes, show_labels, indent="\t\t",
+                            default_fontname=_CLUSTER_FONTNAME, stats=stats)
+            lines.append("\t}\n")
         
         # 添加边
-        self._add_edges(dot, dfg, show_labels)
+        self._add_edges(lines, dfg, show_labels, stats)
         
-        return dot
+        return lines
     
     def _create_dfg_from_json(self, data: Dict[str, Any]) -> DFG:
-        """从JSON数据创建DFG对象"""
-        from ..ast_builder.node_types import DFGNode, DFGEdge, EdgeType, ASTNode, SourceLocation
+        """从JSON数据创建DFG对象（会逐项消耗data中的nodes/edges以降低峰值内存）"""
+        from ..ast_builder.node_types import DFGNode, DFGEdge, EdgeType, ASTNode, SourceLocation, NodeType
         
         # 创建DFG
         dfg = DFG(
@@ -313,10 +421,12 @@ class DFGVisualizer:
             metadata=data.get("metadata", {})
         )
         
-        # 创建节点
-        for node_id, node_data in data["nodes"].items():
+        # 创建节点；每个节点的JSON字典转换后立即释放
+        nodes_data = data.pop("nodes")
+        for node_id in list(nodes_data):
+            node_data = nodes_data.pop(node_id)
+            
             # 创建虚拟AST节点
-            from ..ast_builder.node_types import NodeType
             ast_node = ASTNode(
                 node_id=node_data["id"],
                 node_type=NodeType.IDENTIFIER,  # 使用默认类型
@@ -347,8 +457,10 @@ class DFGVisualizer:
             
             dfg.nodes[node_id] = dfg_node
         
-        # 创建边
-        for edge_id, edge_data in data["edges"].items():
+        # 创建边；同样逐条释放
+        edges_data = data.pop("edges")
+        for edge_id in list(edges_data):
+            edge_data = edges_data.pop(edge_id)
             edge_type = EdgeType(edge_data["type"])
             
             dfg_edge = DFGEdge(
@@ -365,45 +477,43 @@ class DFGVisualizer:
         
         return dfg
     
-    def export_statistics(self, dfg: DFG, output_path: str) -> bool:
-        """导出可视化统计信息"""
+    def export_statistics(self, dfg: DFG, output_path: str,
+                          visualization_stats: Optional[Dict[str, Any]] = None) -> bool:
+        """导出可视化统计信息（可传入visualize_dfg收集的stats以免重复遍历）"""
         try:
+            if not visualization_stats:
+                # 统计节点类型和边类型
+                counts = {
+                    "node_types": Counter(node.node_type for node in dfg.nodes.values()),
+                    "edge_types": Counter(edge.edge_type.value for edge in dfg.edges.values()),
+                    "scopes": {node.scope for node in dfg.nodes.values() if node.scope}
+                }
+                visualization_stats = self._summarize_stats(dfg, counts)
+            
             stats = {
                 "contract": dfg.contract_name,
                 "solidity_version": dfg.solidity_version,
-                "visualization_stats": {
-                    "total_nodes": len(dfg.nodes),
-                    "total_edges": len(dfg.edges),
-                    "node_types": {},
-                    "edge_types": {},
-                    "scopes": set()
-                }
+                "visualization_stats": visualization_stats
             }
             
-            # 统计节点类型
-            for node in dfg.nodes.values():
-                node_type = node.node_type
-                stats["visualization_stats"]["node_types"][node_type] = \
-                    stats["visualization_stats"]["node_types"].get(node_type, 0) + 1
-                
-                if node.scope:
-                    stats["visualization_stats"]["scopes"].add(node.scope)
-            
-            # 统计边类型
-            for edge in dfg.edges.values():
-                edge_type = edge.edge_type.value
-                stats["visualization_stats"]["edge_types"][edge_type] = \
-                    stats["visualization_stats"]["edge_types"].get(edge_type, 0) + 1
-            
-            # 转换set为list
-            stats["visualization_stats"]["scopes"] = list(stats["visualization_stats"]["scopes"])
-            
-            # 保存统计信息
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, indent=2, ensure_ascii=False)
+            # 保存统计信息（紧凑格式，一次性编码后写入）
+            Path(output_path).write_bytes(
+                json.dumps(stats, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            )
             
             return True
         
         except Exception as e:
             print(f"Error exporting visualization statistics: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    @staticmethod
+    def _summarize_stats(dfg: DFG, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """将累计的计数整理为visualization_stats格式"""
+        return {
+            "total_nodes": len(dfg.nodes),
+            "total_edges": len(dfg.edges),
+            "node_types": dict(counts.get("node_types", ())),
+            "edge_types": dict(counts.get("edge_types", ())),
+            "scopes": list(counts.get("scopes", ()))
+        }
@@ -0,0 +1,8 @@
+"""
+pytest 配置：为整个测试套件统一添加项目根目录到Python路径
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -5,11 +5,31 @@
 
 import sys
 import unittest
+import importlib.util
 from pathlib import Path
 
 # 添加src目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# 已加载的测试模块缓存（模块名 -> 模块）
+_loaded_modules = {}
+
+
+def load_test_module(test_file: Path):
+    """按文件路径加载测试模块，同一进程内重复调用直接返回缓存的模块"""
+    module_name = test_file.stem
+    if module_name not in _loaded_modules:
+        spec = importlib.util.spec_from_file_location(module_name, test_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        _loaded_modules[module_name] = module
+    return _loaded_modules[module_name]
+
 
 def run_all_tests():
     """运行所有单元测试"""
@@ -58,8 +78,7 @@ def list_available_tests():
         
         # 尝试导入并列出测试用例
         try:
-            module_name = test_file.stem
-            module = __import__(module_name)
+            module = load_test_module(test_file)
             
             # 找到所有TestCase类
             test_cases = [
@@ -6,9 +6,9 @@
 
 import sys
 import os
-import json
-import tempfile
 import unittest
+from unittest import mock
+from dataclasses import astuple
 from pathlib import Path
 
 # 添加src目录到Python路径
@@ -26,13 +26,19 @@ from src.utils.config_manager import (
 class TestLLMProviderConfig(unittest.TestCase):
     """LLM提供商配置测试"""
     
+    def setUp(self):
+        """隔离环境变量：清除LLM_*变量，测试结束后恢复原环境"""
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for key in ("LLM_API_KEY", "LLM_BASE_URL", "LLM_MODEL"):
+            os.environ.pop(key, None)
+    
     def test_default_creation(self):
         """测试默认配置创建"""
         config = LLMProviderConfig()
-        self.assertEqual(config.name, "qwen")
-        self.assertIsNone(config.api_key)
-        self.assertIsNone(config.base_url)
-        self.assertIsNone(config.model)
+        # (name, api_key, base_url, model)
+        self.assertEqual(astuple(config), ("qwen", None, None, None))
     
     def test_custom_creation(self):
         """测试自定义配置创建"""
@@ -42,42 +48,35 @@ class TestLLMProviderConfig(unittest.TestCase):
             base_url="https://api.test.com",
             model="gpt-4"
         )
-        self.assertEqual(config.name, "openai")
-        self.assertEqual(config.api_key, "test-key")
-        self.assertEqual(config.base_url, "https://api.test.com")
-        self.assertEqual(config.model, "gpt-4")
+        self.assertEqual(astuple(config),
+                         ("openai", "test-key", "https://api.test.com", "gpt-4"))
     
     def test_load_from_env_qwen(self):
         """测试从环境变量加载Qwen配置"""
-        os.environ["LLM_API_KEY"] = "test-key"
-        os.environ["LLM_MODEL"] = "qwen-turbo"
-        
-        config = LLMProviderConfig(name="qwen")
-        config.load_from_env()
+        with mock.patch.dict(os.environ, {"LLM_API_KEY": "test-key", "LLM_MODEL": "qwen-turbo"}):
+            config = LLMProviderConfig(name="qwen")
+            config.load_from_env()
         
-        self.assertEqual(config.api_key, "test-key")
-        self.assertEqual(config.model, "qwen-turbo")
-        self.assertEqual(config.base_url, "https://dashscope.aliyuncs.com/compatible-mode/v1")
-        
-        # Clean up
-        del os.environ["LLM_API_KEY"]
-        del os.environ["LLM_MODEL"]
+        self.assertEqual(
+            astuple(config),
+            ("qwen", "test-key", "https://dashscope.aliyuncs.com/compatible-mode/v1", "qwen-turbo")
+        )
     
     def test_load_from_env_deepseek(self):
         """测试从环境变量加载DeepSeek配置"""
         config = LLMProviderConfig(name="deepseek")
         config.load_from_env()
         
-        self.assertEqual(config.base_url, "https://api.deepseek.com")
-        self.assertEqual(config.model, "deepseek-chat")
+        self.assertEqual((config.base_url, config.model),
+                         ("https://api.deepseek.com", "deepseek-chat"))
     
     def test_load_from_env_openai(self):
         """测试从环境变量加载OpenAI配置"""
         config = LLMProviderConfig(name="openai")
         config.load_from_env()
         
-        self.assertEqual(config.base_url, "https://api.openai.com/v1")
-        self.assertEqual(config.model, "gpt-4")
+        self.assertEqual((config.base_url, config.model),
+                         ("https://api.openai.com/v1", "gpt-4"))
 
 
 class TestDetectionConfig(unittest.TestCase):
@@ -86,12 +85,11 @@ class TestDetectionConfig(unittest.TestCase):
     def test_default_creation(self):
         """测试默认配置创建"""
         config = DetectionConfig()
-        self.assertFalse(config.enabled)
-        self.assertEqual(config.concurrency_limit, 40)
-        self.assertTrue(config.cache_enabled)
-        self.assertEqual(config.cache_dir, "cache")
-        self.assertEqual(config.timeout, 60)
-        self.assertEqual(config.max_retries, 3)
+        self.assertEqual(
+            (config.enabled, config.concurrency_limit, config.cache_enabled,
+             config.cache_dir, config.timeout, config.max_retries),
+            (False, 40, True, "cache", 60, 3)
+        )
         self.assertIsInstance(config.provider, LLMProviderConfig)
     
     def test_custom_creation(self):
@@ -103,10 +101,10 @@ class TestDetectionConfig(unittest.TestCase):
             cache_enabled=False,
             provider=provider
         )
-        self.assertTrue(config.enabled)
-        self.assertEqual(config.concurrency_limit, 20)
-        self.assertFalse(config.cache_enabled)
-        self.assertEqual(config.provider.name, "openai")
+        self.assertEqual(
+            (config.enabled, config.concurrency_limit, config.cache_enabled, config.provider.name),
+            (True, 20, False, "openai")
+        )
 
 
 class TestDFGConfig(unittest.TestCase):
@@ -116,7 +114,7 @@ class TestDFGConfig(unittest.TestCase):
         """测试默认配置创建"""
         config = DFGConfig()
         self.assertEqual(config.mode, "standard")
-        self.assertIsInstance(config.include_types, list)
+        self.assertIsInstance(config.include_types, tuple)
         self.assertIn("contract_definition", config.include_types)
         self.assertIn("function_definition", config.include_types)
     
@@ -134,11 +132,8 @@ class TestOutputConfig(unittest.TestCase):
     def test_default_creation(self):
         """测试默认配置创建"""
         config = OutputConfig()
-        self.assertEqual(config.format, "json")
-        self.assertEqual(config.output_dir, "output")
-        self.assertTrue(config.prettify)
-        self.assertTrue(config.include_metadata)
-        self.assertFalse(config.include_source_code)
+        # (format, output_dir, prettify, include_metadata, include_source_code)
+        self.assertEqual(astuple(config), ("json", "output", True, True, False))
 
 
 class TestPipelineConfig(unittest.TestCase):
@@ -155,6 +150,9 @@ class TestPipelineConfig(unittest.TestCase):
     
     def test_load_from_file(self):
         """测试从文件加载配置"""
+        import json
+        import tempfile
+        
         # 创建临时配置文件
         config_data = {
             "solidity_version": "0.8.x",
@@ -175,18 +173,17 @@ class TestPipelineConfig(unittest.TestCase):
             "verbose": True
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(json.dumps(config_data).encode('utf-8'))
             temp_path = f.name
         
         try:
             config = PipelineConfig.load_from_file(temp_path)
-            self.assertEqual(config.solidity_version, "0.8.x")
-            self.assertEqual(config.dfg.mode, "compact")
-            self.assertTrue(config.detection.enabled)
-            self.assertEqual(config.detection.concurrency_limit, 20)
-            self.assertEqual(config.output.output_dir, "custom_output")
-            self.assertTrue(config.verbose)
+            self.assertEqual(
+                (config.solidity_version, config.dfg.mode, config.detection.enabled,
+                 config.detection.concurrency_limit, config.output.output_dir, config.verbose),
+                ("0.8.x", "compact", True, 20, "custom_output", True)
+            )
         finally:
             os.unlink(temp_path)
     
@@ -197,6 +194,9 @@ class TestPipelineConfig(unittest.TestCase):
     
     def test_save_to_file(self):
         """测试保存配置到文件"""
+        import json
+        import tempfile
+        
         config = PipelineConfig(
             solidity_version="0.8.x",
             verbose=True
@@ -211,10 +211,9 @@ class TestPipelineConfig(unittest.TestCase):
             # 验证文件存在且可以读取
             self.assertTrue(os.path.exists(temp_path))
             
-            with open(temp_path, 'r') as f:
-                data = json.load(f)
-                self.assertEqual(data['solidity_version'], "0.8.x")
-                self.assertTrue(data['verbose'])
+            data = json.loads(Path(temp_path).read_bytes())
+            self.assertEqual(data['solidity_version'], "0.8.x")
+            self.assertTrue(data['verbose'])
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
@@ -238,13 +237,12 @@ class TestPipelineConfig(unittest.TestCase):
         
         config = PipelineConfig.load_from_args(args)
         
-        self.assertTrue(config.detection.enabled)
-        self.assertEqual(config.dfg.mode, 'compact')
-        self.assertEqual(config.output.output_dir, 'custom_output')
-        self.assertEqual(config.detection.provider.api_key, 'new-key')
-        self.assertEqual(config.detection.concurrency_limit, 30)
-        self.assertTrue(config.verbose)
-        self.assertEqual(config.detection.provider.name, 'qwen')
+        self.assertEqual(
+            (config.detection.enabled, config.dfg.mode, config.output.output_dir,
+             config.detection.provider.api_key, config.detection.concurrency_limit,
+             config.verbose, config.detection.provider.name),
+            (True, 'compact', 'custom_output', 'new-key', 30, True, 'qwen')
+        )
 
 
 if __name__ == '__main__':
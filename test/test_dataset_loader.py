@@ -5,8 +5,10 @@
 """
 
 import sys
+import io
 import json
 import tempfile
+import shutil
 import os
 import unittest
 from pathlib import Path
@@ -17,36 +19,56 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.utils.dataset_loader import DatasetLoader
 from src.utils.result import Result
 
+_saved_tempdir = None
+
+
+def setUpModule():
+    """临时文件优先放在内存文件系统（TEST_TMPDIR_FAST，否则/dev/shm）"""
+    global _saved_tempdir
+    _saved_tempdir = tempfile.tempdir
+    fast_dir = os.environ.get('TEST_TMPDIR_FAST') or '/dev/shm'
+    if os.path.isdir(fast_dir) and os.access(fast_dir, os.W_OK):
+        tempfile.tempdir = fast_dir
+
+
+def tearDownModule():
+    """恢复默认临时目录"""
+    tempfile.tempdir = _saved_tempdir
+
+
+def _emit_dataset(count, num_labels, name_prefix="C"):
+    """直接生成 [{"code": "contract <prefix><i> {}", "label": i % num_labels}, ...] 的JSON字节"""
+    return b'[' + b','.join(
+        f'{{"code":"contract {name_prefix}{i} {{}}","label":{i % num_labels}}}'.encode()
+        for i in range(count)
+    ) + b']'
+
 
 class TestDatasetLoader(unittest.TestCase):
     """数据集加载器测试"""
     
+    @classmethod
+    def setUpClass(cls):
+        """生成各测试共用的数据集内容（通过内存缓冲区传给加载器）"""
+        cls.two_records = json.dumps([
+            {"code": "contract A {}", "label": 0},
+            {"code": "contract B {}", "label": 1}
+        ]).encode('utf-8')
+        cls.hundred_records = _emit_dataset(100, 2)
+    
     def setUp(self):
         """测试前准备"""
         self.loader = DatasetLoader()
     
     def test_load_valid_json_dataset(self):
         """测试加载有效JSON数据集"""
-        # 创建临时数据集文件
-        dataset = [
-            {"code": "contract A {}", "label": 0},
-            {"code": "contract B {}", "label": 1}
-        ]
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(dataset, f)
-            temp_path = f.name
+        result = self.loader.load_dataset(io.BytesIO(self.two_records))
         
-        try:
-            result = self.loader.load_dataset(temp_path)
-            
-            self.assertTrue(result.is_success)
-            data = result.value
-            self.assertEqual(len(data), 2)
-            self.assertIn("code", data[0])
-            self.assertIn("label", data[0])
-        finally:
-            os.unlink(temp_path)
+        self.assertTrue(result.is_success)
+        data = result.value
+        self.assertEqual(len(data), 2)
+        self.assertIn("code", data[0])
+        self.assertIn("label", data[0])
     
     def test_load_nonexistent_file(self):
         """测试加载不存在的文件"""
@@ -57,33 +79,88 @@ class TestDatasetLoader(unittest.TestCase):
     
     def test_load_invalid_json(self):
         """测试加载无效JSON"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("{ invalid json")
+        result = self.loader.load_dataset(io.BytesIO(b"{ invalid json"))
+        self.assertTrue(result.is_failure)
+    
+    def test_load_invalid_utf8(self):
+        """测试加载非UTF-8编码文件时返回通用加载错误"""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(b'[{"code": "\xff"}]')
             temp_path = f.name
         
         try:
-            result = self.loader.load_dataset(temp_path)
-            self.assertTrue(result.is_failure)
+            for load in (DatasetLoader.load_json_dataset, DatasetLoader.load_dataset):
+                with self.subTest(loader=load.__name__):
+                    result = load(temp_path)
+                    
+                    self.assertTrue(result.is_failure)
+                    self.assertTrue(result.error.startswith("Failed to load dataset"))
         finally:
             os.unlink(temp_path)
     
+    def test_unsupported_format_error(self):
+        """测试不支持的数据集格式返回格式错误信息"""
+        result = self.loader.load_dataset(io.BytesIO(b'{"items": []}'))
+        
+        self.assertTrue(result.is_failure)
+        self.assertIn("'contracts' or 'data'", result.error)
+    
     def test_load_dataset_with_limit(self):
         """测试限制加载数量"""
-        dataset = [
-            {"code": f"contract C{i} {{}}", "label": i % 2}
-            for i in range(100)
-        ]
+        result = self.loader.load_dataset(io.BytesIO(self.hundred_records), limit=10)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(dataset, f)
+        self.assertTrue(result.is_success)
+        data = result.value
+        self.assertEqual(len(data), 10)
+    
+    def test_load_json_lines_dataset(self):
+        """测试加载JSON Lines数据集"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('{"code": "contract A {}", "label": 0}\n')
+            f.write('{"code": "contract B {}", "label": 1}\n')
             temp_path = f.name
         
         try:
-            result = self.loader.load_dataset(temp_path, limit=10)
+            result = DatasetLoader.load_json_dataset(temp_path)
             
             self.assertTrue(result.is_success)
-            data = result.value
-            self.assertEqual(len(data), 10)
+            entries = result.value
+            self.assertEqual(len(entries), 2)
+            self.assertEqual(entries[1].code, "contract B {}")
+            self.assertEqual(entries[1].label, 1)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_load_single_line_json_lines_dataset(self):
+        """测试加载只有一条记录的JSON Lines数据集"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('{"code": "contract A {}", "label": 0}\n')
+            temp_path = f.name
+        
+        try:
+            for load in (DatasetLoader.load_json_dataset, DatasetLoader.load_dataset):
+                with self.subTest(loader=load.__name__):
+                    result = load(temp_path)
+                    
+                    self.assertTrue(result.is_success)
+                    self.assertEqual(len(result.value), 1)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_duplicate_codes_share_object(self):
+        """测试重复代码共享同一字符串对象"""
+        dataset = [
+            {"code": "contract A {}", "label": 0},
+            {"code": "contract A {}", "label": 1}
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(json.dumps(dataset).encode('utf-8'))
+            temp_path = f.name
+        
+        try:
+            entries = DatasetLoader.load_json_dataset(temp_path).value
+            self.assertIs(entries[0].code, entries[1].code)
         finally:
             os.unlink(temp_path)
     
@@ -136,6 +213,18 @@ class TestDatasetLoader(unittest.TestCase):
         self.assertEqual(labels[1], 1)
         self.assertIsNone(labels[2])
     
+    def test_extract_codes_and_labels(self):
+        """测试一次遍历同时提取代码和标签"""
+        dataset = [
+            {"code": "contract A {}", "label": 0},
+            {"code": "contract B {}"}
+        ]
+        
+        codes, labels = self.loader.extract(dataset)
+        
+        self.assertEqual(codes, self.loader.extract_codes(dataset))
+        self.assertEqual(labels, self.loader.extract_labels(dataset))
+    
     def test_filter_by_label(self):
         """测试按标签过滤"""
         dataset = [
@@ -159,74 +248,60 @@ class TestDatasetLoader(unittest.TestCase):
 class TestDatasetLoaderIntegration(unittest.TestCase):
     """数据集加载器集成测试"""
     
+    @classmethod
+    def setUpClass(cls):
+        """创建各测试共用的只读数据集文件"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.twenty_path = os.path.join(cls.temp_dir, 'twenty.json')
+        Path(cls.twenty_path).write_bytes(_emit_dataset(20, 2, "Test"))
+        cls.thousand_path = os.path.join(cls.temp_dir, 'thousand.json')
+        Path(cls.thousand_path).write_bytes(_emit_dataset(1000, 3))
+    
+    @classmethod
+    def tearDownClass(cls):
+        """删除共用的数据集文件"""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
     def test_complete_workflow(self):
         """测试完整工作流"""
-        # 创建测试数据集
-        dataset = [
-            {"code": f"contract Test{i} {{}}", "label": i % 2}
-            for i in range(20)
-        ]
+        loader = DatasetLoader()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(dataset, f)
-            temp_path = f.name
+        # 加载数据集
+        result = loader.load_dataset(self.twenty_path, limit=10)
+        self.assertTrue(result.is_success)
         
-        try:
-            loader = DatasetLoader()
-            
-            # 加载数据集
-            result = loader.load_dataset(temp_path, limit=10)
-            self.assertTrue(result.is_success)
-            
-            data = result.value
-            
-            # 验证数据集
-            validation = loader.validate_dataset(data)
-            self.assertTrue(validation.is_success)
-            
-            # 提取代码和标签
-            codes = loader.extract_codes(data)
-            labels = loader.extract_labels(data)
-            
-            self.assertEqual(len(codes), 10)
-            self.assertEqual(len(labels), 10)
-            
-            # 按标签过滤
-            label_0 = loader.filter_by_label(data, 0)
-            label_1 = loader.filter_by_label(data, 1)
-            
-            self.assertEqual(len(label_0) + len(label_1), 10)
-            
-        finally:
-            os.unlink(temp_path)
+        data = result.value
+        
+        # 验证数据集
+        validation = loader.validate_dataset(data)
+        self.assertTrue(validation.is_success)
+        
+        # 提取代码和标签
+        codes = loader.extract_codes(data)
+        labels = loader.extract_labels(data)
+        
+        self.assertEqual(len(codes), 10)
+        self.assertEqual(len(labels), 10)
+        
+        # 按标签过滤
+        label_0 = loader.filter_by_label(data, 0)
+        label_1 = loader.filter_by_label(data, 1)
+        
+        self.assertEqual(len(label_0) + len(label_1), 10)
     
     def test_large_dataset_handling(self):
         """测试大数据集处理"""
-        # 创建大数据集
-        dataset = [
-            {"code": f"contract C{i} {{}}", "label": i % 3}
-            for i in range(1000)
-        ]
+        loader = DatasetLoader()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(dataset, f)
-            temp_path = f.name
+        # 不限制
+        result = loader.load_dataset(self.thousand_path)
+        self.assertTrue(result.is_success)
+        self.assertEqual(len(result.value), 1000)
         
-        try:
-            loader = DatasetLoader()
-            
-            # 不限制
-            result = loader.load_dataset(temp_path)
-            self.assertTrue(result.is_success)
-            self.assertEqual(len(result.value), 1000)
-            
-            # 限制100条
-            result = loader.load_dataset(temp_path, limit=100)
-            self.assertTrue(result.is_success)
-            self.assertEqual(len(result.value), 100)
-            
-        finally:
-            os.unlink(temp_path)
+        # 限制100条
+        result = loader.load_dataset(self.thousand_path, limit=100)
+        self.assertTrue(result.is_success)
+        self.assertEqual(len(result.value), 100)
 
 
 if __name__ == '__main__':
@@ -53,44 +53,40 @@ class TestDFGConfig(unittest.TestCase):
     def test_default_config(self):
         """测试默认配置"""
         config = DFGConfig()
-        self.assertEqual(config.output_mode, OutputMode.STANDARD)
-        self.assertTrue(config.skip_keywords)
-        self.assertTrue(config.skip_type_names)
-        self.assertFalse(config.skip_literal_nodes)
-        self.assertEqual(config.min_node_priority, NodePriority.IMPORTANT)
+        self.assertEqual(
+            (config.output_mode, config.skip_keywords, config.skip_type_names,
+             config.skip_literal_nodes, config.min_node_priority),
+            (OutputMode.STANDARD, True, True, False, NodePriority.IMPORTANT)
+        )
     
     def test_compact_config(self):
         """测试紧凑模式配置"""
         config = DFGConfig.compact()
-        self.assertEqual(config.output_mode, OutputMode.COMPACT)
-        self.assertTrue(config.skip_keywords)
-        self.assertTrue(config.skip_type_names)
-        self.assertTrue(config.skip_operators)
-        self.assertTrue(config.skip_punctuation)
-        self.assertTrue(config.skip_literal_nodes)
-        self.assertFalse(config.include_node_text)
-        self.assertEqual(config.min_node_priority, NodePriority.CRITICAL)
+        self.assertEqual(
+            (config.output_mode, config.skip_keywords, config.skip_type_names,
+             config.skip_operators, config.skip_punctuation, config.skip_literal_nodes,
+             config.include_node_text, config.min_node_priority),
+            (OutputMode.COMPACT, True, True, True, True, True, False, NodePriority.CRITICAL)
+        )
     
     def test_standard_config(self):
         """测试标准模式配置"""
         config = DFGConfig.standard()
-        self.assertEqual(config.output_mode, OutputMode.STANDARD)
-        self.assertTrue(config.skip_keywords)
-        self.assertTrue(config.skip_type_names)
-        self.assertFalse(config.skip_literal_nodes)
-        self.assertFalse(config.include_node_text)
-        self.assertEqual(config.min_node_priority, NodePriority.IMPORTANT)
+        self.assertEqual(
+            (config.output_mode, config.skip_keywords, config.skip_type_names,
+             config.skip_literal_nodes, config.include_node_text, config.min_node_priority),
+            (OutputMode.STANDARD, True, True, False, False, NodePriority.IMPORTANT)
+        )
     
     def test_verbose_config(self):
         """测试详细模式配置"""
         config = DFGConfig.verbose()
-        self.assertEqual(config.output_mode, OutputMode.VERBOSE)
-        self.assertFalse(config.skip_keywords)
-        self.assertFalse(config.skip_type_names)
-        self.assertFalse(config.skip_literal_nodes)
-        self.assertTrue(config.include_node_text)
-        self.assertTrue(config.include_ast_metadata)
-        self.assertEqual(config.min_node_priority, NodePriority.AUXILIARY)
+        self.assertEqual(
+            (config.output_mode, config.skip_keywords, config.skip_type_names,
+             config.skip_literal_nodes, config.include_node_text, config.include_ast_metadata,
+             config.min_node_priority),
+            (OutputMode.VERBOSE, False, False, False, True, True, NodePriority.AUXILIARY)
+        )
     
     def test_custom_config(self):
         """测试自定义配置"""
@@ -101,11 +97,11 @@ class TestDFGConfig(unittest.TestCase):
             text_max_length=100,
             min_node_priority=NodePriority.CRITICAL
         )
-        self.assertEqual(config.output_mode, OutputMode.CUSTOM)
-        self.assertFalse(config.skip_keywords)
-        self.assertTrue(config.include_node_text)
-        self.assertEqual(config.text_max_length, 100)
-        self.assertEqual(config.min_node_priority, NodePriority.CRITICAL)
+        self.assertEqual(
+            (config.output_mode, config.skip_keywords, config.include_node_text,
+             config.text_max_length, config.min_node_priority),
+            (OutputMode.CUSTOM, False, True, 100, NodePriority.CRITICAL)
+        )
 
 
 class TestNodePriorityFunction(unittest.TestCase):
@@ -236,22 +232,22 @@ class TestKeywordPatterns(unittest.TestCase):
     
     def test_keyword_patterns_exist(self):
         """测试关键字模式列表存在"""
-        self.assertIsInstance(KEYWORD_PATTERNS, (list, tuple, set))
+        self.assertIsInstance(KEYWORD_PATTERNS, (list, tuple, set, frozenset))
         self.assertGreater(len(KEYWORD_PATTERNS), 0)
     
     def test_common_keywords_in_patterns(self):
         """测试常见关键字在模式中"""
-        common_keywords = ["public", "private", "function", "contract", "uint", "address"]
-        for keyword in common_keywords:
-            self.assertIn(keyword, KEYWORD_PATTERNS,
-                         f"{keyword} should be in KEYWORD_PATTERNS")
+        common_keywords = {"public", "private", "function", "contract", "uint", "address"}
+        missing = common_keywords - set(KEYWORD_PATTERNS)
+        self.assertFalse(missing, f"{missing} should be in KEYWORD_PATTERNS")
     
     def test_solidity_types_in_patterns(self):
         """测试Solidity类型在模式中"""
         types = ["uint", "uint256", "address", "bool", "string", "bytes"]
-        for type_name in types:
-            found = any(type_name in pattern for pattern in KEYWORD_PATTERNS)
-            self.assertTrue(found, f"{type_name} should be in KEYWORD_PATTERNS")
+        # 类型名不含空格，在拼接串中查找等价于逐个模式做子串匹配
+        joined = " ".join(KEYWORD_PATTERNS)
+        missing = [type_name for type_name in types if type_name not in joined]
+        self.assertFalse(missing, f"{missing} should be in KEYWORD_PATTERNS")
 
 
 class TestNodeTypeCategories(unittest.TestCase):
@@ -259,19 +255,19 @@ class TestNodeTypeCategories(unittest.TestCase):
     
     def test_critical_types_defined(self):
         """测试关键节点类型已定义"""
-        self.assertIsInstance(CRITICAL_NODE_TYPES, (list, tuple, set))
+        self.assertIsInstance(CRITICAL_NODE_TYPES, (list, tuple, set, frozenset))
         self.assertGreater(len(CRITICAL_NODE_TYPES), 0)
         self.assertIn("contract", CRITICAL_NODE_TYPES)
         self.assertIn("function", CRITICAL_NODE_TYPES)
     
     def test_important_types_defined(self):
         """测试重要节点类型已定义"""
-        self.assertIsInstance(IMPORTANT_NODE_TYPES, (list, tuple, set))
+        self.assertIsInstance(IMPORTANT_NODE_TYPES, (list, tuple, set, frozenset))
         self.assertGreater(len(IMPORTANT_NODE_TYPES), 0)
     
     def test_auxiliary_types_defined(self):
         """测试辅助节点类型已定义"""
-        self.assertIsInstance(AUXILIARY_NODE_TYPES, (list, tuple, set))
+        self.assertIsInstance(AUXILIARY_NODE_TYPES, (list, tuple, set, frozenset))
         self.assertGreater(len(AUXILIARY_NODE_TYPES), 0)
     
     def test_no_overlap_in_categories(self):
@@ -8,8 +8,9 @@ import sys
 import unittest
 from pathlib import Path
 
-# 添加src目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# 直接运行脚本时添加项目根目录到Python路径（pytest 由 conftest.py 统一处理）
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.result import Result
 from src.utils.functional_helpers import (
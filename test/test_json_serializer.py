@@ -7,22 +7,39 @@ JSON序列化器单元测试
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace as NS
 
-# 添加src目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# 直接运行脚本时添加项目根目录到Python路径（pytest 由 conftest.py 统一处理）
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.json_serializer import JSONSerializer
 from src.dfg_builder.dfg_config import DFGConfig, OutputMode
 
+# 只读的预设配置，模块加载时构造一次
+_STD_CFG, _COMPACT_CFG = DFGConfig.standard(), DFGConfig.compact()
+
+
+def _mock_dfg(nodes=None, edges=None, entry=None):
+    """构造模拟DFG（合约名为Test，版本为0.4.25）"""
+    return NS(
+        contract_name="Test",
+        solidity_version="0.4.25",
+        nodes=nodes or {},
+        edges=edges or {},
+        entry_node_id=entry,
+        metadata={}
+    )
+
 
 class TestJSONSerializer(unittest.TestCase):
     """JSON序列化器测试"""
     
-    def setUp(self):
-        """测试前准备"""
-        self.config = DFGConfig.standard()
-        self.serializer = JSONSerializer(config=self.config)
+    @classmethod
+    def setUpClass(cls):
+        """测试类准备：配置和序列化器不会被测试修改，全类共用"""
+        cls.config = _STD_CFG
+        cls.serializer = JSONSerializer(config=cls.config)
     
     def test_initialization(self):
         """测试序列化器初始化"""
@@ -35,8 +52,7 @@ class TestJSONSerializer(unittest.TestCase):
     
     def test_initialization_with_config(self):
         """测试使用配置初始化"""
-        config = DFGConfig.compact()
-        serializer = JSONSerializer(config=config)
+        serializer = JSONSerializer(config=_COMPACT_CFG)
         self.assertEqual(serializer.config.output_mode, OutputMode.COMPACT)
     
     def test_serialize_empty_dfg(self):
@@ -47,21 +63,13 @@ class TestJSONSerializer(unittest.TestCase):
     def test_serialize_dfg_structure(self):
         """测试DFG序列化结构"""
         # 创建模拟DFG对象
-        mock_dfg = Mock()
+        mock_dfg = _mock_dfg(entry="node_0")
         mock_dfg.contract_name = "TestContract"
-        mock_dfg.solidity_version = "0.4.25"
-        mock_dfg.nodes = {}
-        mock_dfg.edges = {}
-        mock_dfg.entry_node_id = "node_0"
         
         result = self.serializer.serialize_dfg(mock_dfg)
         
-        self.assertIn("contract", result)
-        self.assertIn("solidity_version", result)
-        self.assertIn("nodes", result)
-        self.assertIn("edges", result)
-        self.assertIn("metadata", result)
-        self.assertIn("entry_node_id", result)
+        expected = {"contract", "solidity_version", "nodes", "edges", "metadata", "entry_node_id"}
+        self.assertLessEqual(expected, result.keys())
         
         self.assertEqual(result["contract"], "TestContract")
         self.assertEqual(result["solidity_version"], "0.4.25")
@@ -70,25 +78,17 @@ class TestJSONSerializer(unittest.TestCase):
     def test_serialize_node_basic_fields(self):
         """测试节点序列化基本字段"""
         # 创建模拟节点
-        mock_ast_node = Mock()
-        mock_ast_node.text = "myFunction"
-        mock_ast_node.source_location = None
-        
-        mock_node = Mock()
-        mock_node.node_id = "node_1"
-        mock_node.node_type = "function"
-        mock_node.name = "myFunction"
-        mock_node.data_type = "function"
-        mock_node.scope = "contract"
-        mock_node.ast_node = mock_ast_node
-        mock_node.properties = {"visibility": "public"}
-        
-        mock_dfg = Mock()
-        mock_dfg.contract_name = "Test"
-        mock_dfg.solidity_version = "0.4.25"
-        mock_dfg.nodes = {"node_1": mock_node}
-        mock_dfg.edges = {}
-        mock_dfg.entry_node_id = None
+        mock_node = NS(
+            node_id="node_1",
+            node_type="function",
+            name="myFunction",
+            data_type="function",
+            scope="contract",
+            ast_node=NS(text="myFunction", source_location=None),
+            properties={"visibility": "public"}
+        )
+        
+        mock_dfg = _mock_dfg(nodes={"node_1": mock_node})
         
         result = self.serializer.serialize_dfg(mock_dfg)
         
@@ -102,83 +102,63 @@ class TestJSONSerializer(unittest.TestCase):
         self.assertEqual(node["name"], "myFunction")
         self.assertIn("properties", node)
     
-    def test_node_text_inclusion_based_on_config(self):
-        """测试基于配置包含节点文本"""
-        # 配置包含文本
-        config_with_text = DFGConfig(include_node_text=True)
-        serializer = JSONSerializer(config=config_with_text)
-        
-        mock_ast_node = Mock()
-        mock_ast_node.text = "test text"
-        
-        mock_node = Mock()
-        mock_node.node_id = "node_1"
-        mock_node.node_type = "identifier"
-        mock_node.name = "test"
-        mock_node.data_type = None
-        mock_node.scope = None
-        mock_node.ast_node = mock_ast_node
-        mock_node.properties = {}
-        
-        mock_dfg = Mock()
-        mock_dfg.contract_name = "Test"
-        mock_dfg.solidity_version = "0.4.25"
-        mock_dfg.nodes = {"node_1": mock_node}
-        mock_dfg.edges = {}
-        mock_dfg.entry_node_id = None
-        
-        result = serializer.serialize_dfg(mock_dfg)
-        self.assertIn("text", result["nodes"]["node_1"])
-        self.assertEqual(result["nodes"]["node_1"]["text"], "test text")
-    
-    def test_node_text_truncation(self):
-        """测试节点文本截断"""
-        config = DFGConfig(include_node_text=True, text_max_length=10)
-        serializer = JSONSerializer(config=config)
-        
-        mock_ast_node = Mock()
-        mock_ast_node.text = "this is a very long text that should be truncated"
-        
-        mock_node = Mock()
-        mock_node.node_id = "node_1"
-        mock_node.node_type = "identifier"
-        mock_node.name = "test"
-        mock_node.data_type = None
-        mock_node.scope = None
-        mock_node.ast_node = mock_ast_node
-        mock_node.properties = {}
-        
-        mock_dfg = Mock()
-        mock_dfg.contract_name = "Test"
-        mock_dfg.solidity_version = "0.4.25"
-        mock_dfg.nodes = {"node_1": mock_node}
-        mock_dfg.edges = {}
-        mock_dfg.entry_node_id = None
-        
-        result = serializer.serialize_dfg(mock_dfg)
-        text = result["nodes"]["node_1"]["text"]
-        self.assertTrue(len(text) <= 13)  # 10 + "..."
-        self.assertTrue(text.endswith("..."))
+    def test_node_text_variants(self):
+        """测试基于配置包含节点文本及文本截断"""
+        mock_ast_node = NS(text=None, source_location=None)
+        
+        mock_node = NS(
+            node_id="node_1",
+            node_type="identifier",
+            name="test",
+            data_type=None,
+            scope=None,
+            ast_node=mock_ast_node,
+            properties={}
+        )
+        
+        mock_dfg = _mock_dfg(nodes={"node_1": mock_node})
+        
+        # (文本最大长度, 节点文本, 是否应被截断)
+        cases = [
+            (None, "test text", False),
+            (10, "long " * 20, True),
+        ]
+        
+        for max_length, text, should_truncate in cases:
+            with self.subTest(max_length=max_length, should_truncate=should_truncate):
+                # CUSTOM模式不会用模式默认值覆盖include_node_text
+                options = {"output_mode": OutputMode.CUSTOM, "include_node_text": True}
+                if max_length is not None:
+                    options["text_max_length"] = max_length
+                config = DFGConfig(**options)
+                serializer = JSONSerializer(config=config)
+                mock_ast_node.text = text
+                
+                result = serializer.serialize_dfg(mock_dfg)
+                self.assertIn("text", result["nodes"]["node_1"])
+                serialized_text = result["nodes"]["node_1"]["text"]
+                
+                if should_truncate:
+                    self.assertTrue(len(serialized_text) <= max_length + 3)  # max_length + "..."
+                    self.assertTrue(serialized_text.endswith("..."))
+                else:
+                    self.assertEqual(serialized_text, text)
     
     def test_serialize_edge(self):
         """测试边序列化"""
         from src.ast_builder.node_types import EdgeType
         
-        mock_edge = Mock()
-        mock_edge.edge_id = "edge_1"
-        mock_edge.source_node_id = "node_1"
-        mock_edge.target_node_id = "node_2"
-        mock_edge.edge_type = EdgeType.CONTROL_FLOW
-        mock_edge.label = "if_true"
-        mock_edge.weight = 1.0
-        mock_edge.properties = {"condition": "x > 0"}
-        
-        mock_dfg = Mock()
-        mock_dfg.contract_name = "Test"
-        mock_dfg.solidity_version = "0.4.25"
-        mock_dfg.nodes = {}
-        mock_dfg.edges = {"edge_1": mock_edge}
-        mock_dfg.entry_node_id = None
+        mock_edge = NS(
+            edge_id="edge_1",
+            source_node_id="node_1",
+            target_node_id="node_2",
+            edge_type=EdgeType.DATA_DEPENDENCY,
+            label="if_true",
+            weight=1.0,
+            properties={"condition": "x > 0"}
+        )
+        
+        mock_dfg = _mock_dfg(edges={"edge_1": mock_edge})
         
         result = self.serializer.serialize_dfg(mock_dfg)
         
@@ -206,17 +186,19 @@ class TestJSONSerializerIntegration(unittest.TestCase):
         ]
         
         for mode, include_text in modes:
-            config = DFGConfig(output_mode=mode)
-            serializer = JSONSerializer(config=config)
-            
-            self.assertEqual(serializer.config.output_mode, mode)
-            self.assertEqual(serializer.config.include_node_text, include_text)
+            with self.subTest(mode=mode):
+                config = DFGConfig(output_mode=mode)
+                serializer = JSONSerializer(config=config)
+                
+                self.assertEqual(serializer.config.output_mode, mode)
+                self.assertEqual(serializer.config.include_node_text, include_text)
     
     def test_serializer_indentation(self):
         """测试序列化缩进"""
         for indent in [2, 4, None]:
-            serializer = JSONSerializer(indent=indent)
-            self.assertEqual(serializer.indent, indent)
+            with self.subTest(indent=indent):
+                serializer = JSONSerializer(indent=indent)
+                self.assertEqual(serializer.indent, indent)
 
 
 if __name__ == '__main__':
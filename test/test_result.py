@@ -8,13 +8,11 @@ import sys
 import unittest
 from pathlib import Path
 
-# 添加src目录到Python路径  
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 直接运行脚本时添加项目根目录到Python路径（pytest 由 conftest.py 统一处理）
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# 只导入需要的模块，不触发完整的src导入
-sys.path.insert(0, str(project_root / "src" / "utils"))
-from result import Result
+from src.utils.result import Result
 
 
 class TestResult(unittest.TestCase):
@@ -88,6 +86,38 @@ class TestResult(unittest.TestCase):
         self.assertTrue(flat_mapped.is_failure)
         self.assertEqual(flat_mapped.error, "Custom error")
     
+    def test_map_unchecked_on_success(self):
+        """测试在成功结果上不捕获异常的映射"""
+        result = Result.success(10)
+        mapped = result.map_unchecked(lambda x: x * 2)
+        self.assertTrue(mapped.is_success)
+        self.assertEqual(mapped.value, 20)
+    
+    def test_map_unchecked_on_failure(self):
+        """测试在失败结果上不捕获异常的映射"""
+        result = Result.failure("Error")
+        mapped = result.map_unchecked(lambda x: 1 / 0)
+        self.assertTrue(mapped.is_failure)
+        self.assertEqual(mapped.error, "Error")
+    
+    def test_map_unchecked_propagates_exception(self):
+        """测试不捕获异常的映射会抛出异常"""
+        result = Result.success(10)
+        with self.assertRaises(ZeroDivisionError):
+            result.map_unchecked(lambda x: 1 / 0)
+    
+    def test_flat_map_unchecked(self):
+        """测试不捕获异常的平面映射"""
+        result = Result.success(10)
+        flat_mapped = result.flat_map_unchecked(lambda x: Result.success(x * 2))
+        self.assertEqual(flat_mapped.value, 20)
+        
+        failed = Result.failure("Error").flat_map_unchecked(lambda x: Result.success(x))
+        self.assertEqual(failed.error, "Error")
+        
+        with self.assertRaises(ZeroDivisionError):
+            result.flat_map_unchecked(lambda x: 1 / 0)
+    
     def test_unwrap_or_on_success(self):
         """测试成功结果的unwrap_or"""
         result = Result.success(42)
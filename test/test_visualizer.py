@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+DFG可视化器单元测试
+测试DOT文本生成、统计信息和Graphviz调用（subprocess被模拟，不需要dot程序）
+"""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import unittest
+from enum import Enum
+from pathlib import Path
+from unittest import mock
+
+# 直接运行脚本时添加项目根目录到Python路径（pytest 由 conftest.py 统一处理）
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ast_builder.node_types import DFG, DFGNode, DFGEdge, ASTNode, NodeType, EdgeType
+from src.visualization.visualizer import DFGVisualizer, _quote
+
+_RUN = "src.visualization.visualizer.subprocess.run"
+
+
+def _completed(returncode=0, stderr=b""):
+    """构造模拟的 subprocess.run 返回值"""
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=b"", stderr=stderr)
+
+
+def _make_dfg():
+    """构造小型DFG：全局合约节点，以及作用域C中的一个函数和一个状态变量"""
+    def node(node_id, node_type, name, scope, properties=None):
+        return DFGNode(
+            node_id=node_id,
+            ast_node=ASTNode(node_id=node_id, node_type=NodeType.IDENTIFIER),
+            node_type=node_type,
+            name=name,
+            scope=scope,
+            properties=properties
+        )
+    
+    nodes = {
+        "n1": node("n1", "contract", "C", "global"),
+        "n2": node("n2", "function", "pay", "C"),
+        "n3": node("n3", "state_variable", "owner", "C", {"has_constant_modifier": True}),
+    }
+    edges = {
+        "e1": DFGEdge("e1", "n1", "n2", EdgeType.DEFINITION),
+        "e2": DFGEdge("e2", "n3", "n2", EdgeType.DATA_DEPENDENCY, label="x", weight=3),
+    }
+    return DFG(contract_name="C", solidity_version="0.4.25", nodes=nodes, edges=edges)
+
+
+class TestQuote(unittest.TestCase):
+    """DOT字符串引用测试"""
+    
+    def test_quote_cases(self):
+        """测试引号和反斜杠的转义"""
+        cases = [
+            ("plain", '"plain"'),
+            (3, '"3"'),
+            ('a"b', '"a\\"b"'),
+            ('a\\"b', '"a\\"b"'),             # 已转义的引号不再转义
+            ('a\\\\"b', '"a\\\\\\"b"'),       # 转义的反斜杠后跟未转义的引号
+            ("x\\ny", '"x\\ny"'),              # 保留 \n 等转义
+            ("ends\\", '"ends\\\\"'),          # 结尾单个反斜杠
+            ("ends\\\\", '"ends\\\\"'),        # 结尾已成对的反斜杠
+        ]
+        
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(_quote(value), expected)
+
+
+class TestBuildSource(unittest.TestCase):
+    """DOT文本生成测试"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """测试类准备：DFG只读，全类共用"""
+        cls.dfg = _make_dfg()
+    
+    def setUp(self):
+        """测试准备"""
+        self.visualizer = DFGVisualizer()
+    
+    def test_flat_source(self):
+        """测试平铺图的DOT文本"""
+        source = self.visualizer._build_source(self.dfg, show_labels=True, cluster_scopes=False)
+        
+        self.assertTrue(source.startswith("// DFG of C\ndigraph {\n"))
+        self.assertTrue(source.endswith("}\n"))
+        self.assertNotIn("subgraph", source)
+        self.assertIn(
+            '\t"n2" [label="[function]\\npay\\n(C)" shape="ellipse" style="filled" '
+            'fillcolor="lightgreen" fontname="Arial"]\n',
+            source
+        )
+        self.assertIn('peripheries="2"', source)
+        self.assertIn(
+            '\t"n3" -> "n2" [color="black" style="solid" arrowhead="normal" '
+            'label="data_dependency x w:3" penwidth="3"]\n',
+            source
+        )
+    
+    def test_flat_source_without_labels(self):
+        """测试不显示标签时用节点ID作标签且边无标签"""
+        source = self.visualizer._build_source(self.dfg, show_labels=False, cluster_scopes=False)
+        
+        self.assertIn('\t"n1" [label="n1" ', source)
+        self.assertIn('\t"n1" -> "n2" [color="green" style="solid" arrowhead="tee"]\n', source)
+    
+    def test_penwidth_for_weights(self):
+        """测试整数和浮点数权重的线宽"""
+        cases = [(3, '"3"'), (9, '"5"'), (2.0, '"2.0"'), (7.5, '"5"')]
+        
+        for weight, penwidth in cases:
+            with self.subTest(weight=weight):
+                dfg = _make_dfg()
+                dfg.edges["e2"].weight = weight
+                source = self.visualizer._build_source(dfg, show_labels=False, cluster_scopes=False)
+                self.assertIn(f"penwidth={penwidth}", source)
+    
+    def test_unknown_edge_type_uses_default_style(self):
+        """测试不在EdgeType中的边类型使用默认样式"""
+        OtherEdgeType = Enum("OtherEdgeType", {"CUSTOM": "custom"})
+        dfg = _make_dfg()
+        dfg.edges["e1"].edge_type = OtherEdgeType.CUSTOM
+        
+        source = self.visualizer._build_source(dfg, show_labels=True, cluster_scopes=False)
+        self.assertIn(
+            '\t"n1" -> "n2" [color="black" style="solid" arrowhead="normal" label="custom"]\n',
+            source
+        )
+    
+    def test_clustered_source(self):
+        """测试按作用域聚类的DOT文本"""
+        source = self.visualizer._build_source(self.dfg, show_labels=True, cluster_scopes=True)
+        
+        self.assertTrue(source.startswith("// Clustered DFG of C\ndigraph {\n"))
+        self.assertIn('\tnode [fontname="Arial"]\n', source)
+        self.assertEqual(source.count("subgraph"), 1)
+        
+        # 全局节点在主图中，作用域C的节点在聚类中
+        head, cluster = source.split('\tsubgraph "cluster_0" {\n')
+        self.assertIn('\t"n1" [', head)
+        self.assertTrue(cluster.startswith('\t\tlabel="C" style="rounded,dashed"\n'))
+        self.assertIn('\t\t"n2" [', cluster)
+        self.assertIn('\t\t"n3" [', cluster)
+        
+        # 与图级默认相同的字体不逐节点写出
+        self.assertNotIn("fontname", source.replace('node [fontname="Arial"]', ""))
+        self.assertEqual(source.count("{"), source.count("}"))
+    
+    def test_buffer_reuse(self):
+        """测试复用缓冲区时多次生成的文本一致"""
+        first = self.visualizer._build_source(self.dfg, True, True)
+        self.visualizer._build_source(self.dfg, True, False)
+        self.assertEqual(self.visualizer._build_source(self.dfg, True, True), first)
+
+
+class TestVisualizationStats(unittest.TestCase):
+    """可视化统计信息测试"""
+    
+    def test_collected_stats_match_export(self):
+        """测试visualize_dfg收集的统计与export_statistics自行统计的一致"""
+        dfg = _make_dfg()
+        visualizer = DFGVisualizer()
+        
+        for cluster_scopes in (True, False):
+            with self.subTest(cluster_scopes=cluster_scopes), \
+                    tempfile.TemporaryDirectory() as temp_dir, \
+                    mock.patch(_RUN, return_value=_completed()):
+                stats = {}
+                self.assertTrue(visualizer.visualize_dfg(
+                    dfg, str(Path(temp_dir) / "dfg"), cluster_scopes=cluster_scopes, stats=stats
+                ))
+                
+                stats_path = Path(temp_dir) / "stats.json"
+                self.assertTrue(visualizer.export_statistics(dfg, str(stats_path)))
+                exported = json.loads(stats_path.read_bytes())["visualization_stats"]
+                
+                # scopes来自集合，顺序不固定
+                self.assertCountEqual(stats.pop("scopes"), ["global", "C"])
+                self.assertCountEqual(exported.pop("scopes"), ["global", "C"])
+                self.assertEqual(stats, exported)
+                self.assertEqual(stats["node_types"],
+                                 {"contract": 1, "function": 1, "state_variable": 1})
+                self.assertEqual(stats["edge_types"], {"definition": 1, "data_dependency": 1})
+                
+                stats["scopes"] = ["C"]
+                self.assertTrue(visualizer.export_statistics(dfg, str(stats_path), stats))
+                self.assertEqual(json.loads(stats_path.read_bytes())["visualization_stats"], stats)
+
+
+class TestRender(unittest.TestCase):
+    """Graphviz调用测试"""
+    
+    def setUp(self):
+        """测试准备"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+        self.visualizer = DFGVisualizer(format="svg")
+    
+    def test_render_invokes_engine(self):
+        """测试渲染时通过标准输入把DOT文本传给引擎"""
+        output = self.temp_dir / "out" / "graph.dot"
+        
+        with mock.patch(_RUN, return_value=_completed()) as run:
+            self.visualizer._render("digraph {}\n", str(output))
+        
+        run.assert_called_once()
+        args, kwargs = run.call_args
+        self.assertEqual(args[0], ["dot", "-Tsvg", "-o", str(self.temp_dir / "out" / "graph.svg")])
+        self.assertEqual(kwargs["input"], b"digraph {}\n")
+        self.assertTrue((self.temp_dir / "out").is_dir())
+    
+    def test_render_failure_raises(self):
+        """测试引擎返回非零状态时抛出包含stderr的异常"""
+        with mock.patch(_RUN, return_value=_completed(1, b"syntax error")):
+            with self.assertRaisesRegex(RuntimeError, "syntax error"):
+                self.visualizer._render("digraph {", str(self.temp_dir / "graph"))
+
+
+class TestVisualizeFromJson(unittest.TestCase):
+    """从JSON可视化及跳过渲染测试"""
+    
+    def setUp(self):
+        """测试准备：写入DFG JSON，模拟的dot只创建输出文件"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+        
+        self.json_path = self.write_json("dfg.json", "C")
+        self.output = str(self.temp_dir / "dfg")
+        
+        def run(cmd, **kwargs):
+            Path(cmd[-1]).touch()
+            return _completed()
+        
+        patcher = mock.patch(_RUN, side_effect=run)
+        self.run = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.visualizer = DFGVisualizer()
+    
+    def write_json(self, name, contract):
+        """写入只含一个合约节点的DFG JSON"""
+        path = self.temp_dir / name
+        path.write_bytes(json.dumps({
+            "contract": contract,
+            "solidity_version": "0.4.25",
+            "nodes": {"n1": {"id": "n1", "type": "contract", "name": contract, "scope": "global"}},
+            "edges": {}
+        }).encode())
+        return path
+    
+    def render(self, json_path=None, **kwargs):
+        """调用visualize_from_json并返回是否真正调用了dot"""
+        self.run.reset_mock()
+        json_file = str(json_path or self.json_path)
+        self.assertTrue(self.visualizer.visualize_from_json(json_file, self.output, **kwargs))
+        return self.run.called
+    
+    def test_skip_when_up_to_date(self):
+        """测试输出最新且选项相同时跳过，force时重新渲染且不保留记录"""
+        options_path = self.temp_dir / "dfg.png.opts"
+        self.assertTrue(self.render())
+        self.assertTrue(options_path.exists())
+        self.assertFalse(self.render())
+        self.assertTrue(self.render(force=True))
+        self.assertFalse(options_path.exists())
+        self.assertTrue(self.render())
+        self.assertFalse(self.render())
+    
+    def test_different_json_rerender(self):
+        """测试同一输出路径改用另一个（更旧的）JSON时重新渲染"""
+        other = self.write_json("other.json", "D")
+        older = self.json_path.stat().st_mtime_ns - 1_000_000_000
+        os.utime(other, ns=(older, older))
+        
+        self.assertTrue(self.render())
+        self.assertTrue(self.render(other))
+        self.assertFalse(self.render(other))
+    
+    def test_changed_options_rerender(self):
+        """测试渲染选项变化时重新渲染"""
+        self.assertTrue(self.render())
+        self.assertTrue(self.render(cluster_scopes=False))
+        self.assertFalse(self.render(cluster_scopes=False))
+        self.assertTrue(self.render(cluster_scopes=False, show_labels=False))
+    
+    def test_changed_json_rerender(self):
+        """测试JSON比输出新时重新渲染"""
+        self.assertTrue(self.render())
+        
+        newer = (self.temp_dir / "dfg.png").stat().st_mtime_ns + 1_000_000_000
+        os.utime(self.json_path, ns=(newer, newer))
+        self.assertTrue(self.render())
+    
+    def test_direct_render_invalidates_options(self):
+        """测试直接调用visualize_dfg覆盖输出后不再跳过"""
+        self.assertTrue(self.render())
+        
+        target = self.temp_dir / "dfg.png"
+        newer = target.stat().st_mtime_ns + 1_000_000_000
+        os.utime(target, ns=(newer, newer))
+        self.assertTrue(self.render())
+
+
+if __name__ == '__main__':
+    print("🧪 测试 DFG 可视化器")
+    print("=" * 70)
+    unittest.main(verbosity=2)